@@ -12,7 +12,6 @@ import argparse
 import json
 from pathlib import Path
 
-import numpy as np
 
 from . import web_interface
 from .anonymize_dicom import anonymize_dicom
@@ -67,22 +66,22 @@ def cmd_web(args: argparse.Namespace) -> None:
 
 
 def cmd_volume(args: argparse.Namespace) -> None:
-    from .volume_builder import build_volume
+    from .volume_builder import build_volume, build_volume_file, metadata_to_json
 
     directory = Path(args.directory)
-    volume, _, metadata = build_volume(directory)
 
     if args.preview:
-        print(json.dumps(metadata, indent=2))
+        _, _, metadata = build_volume(directory)
+        print(metadata_to_json(metadata).decode("utf-8"))
         return
 
     output_path = Path(args.output) if args.output else Path("output") / f"{directory.name}_volume.npy"
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    np.save(output_path, volume)
+    _, _, metadata = build_volume_file(directory, output_path)
 
     meta_path = Path(args.metadata) if args.metadata else output_path.with_suffix(".json")
     meta_path.parent.mkdir(parents=True, exist_ok=True)
-    meta_path.write_text(json.dumps(metadata, indent=2), encoding="utf-8")
+    meta_path.write_bytes(metadata_to_json(metadata))
 
     print(f"Volume saved to {output_path} (shape={metadata['shape']}, dtype={metadata['dtype']})")
     print(f"Metadata written to {meta_path}")
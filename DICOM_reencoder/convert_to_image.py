@@ -30,11 +30,13 @@ def apply_windowing(pixel_array, window_center, window_width):
     img_min = window_center - window_width // 2
     img_max = window_center + window_width // 2
 
-    # Apply windowing
-    windowed = np.clip(pixel_array, img_min, img_max)
+    # Apply windowing into one float buffer; the caller's array is left untouched
+    windowed = np.empty(pixel_array.shape, dtype=np.float32)
+    np.clip(pixel_array, img_min, img_max, out=windowed)
 
-    # Normalize to 0-255
-    windowed = ((windowed - img_min) / (img_max - img_min) * 255.0)
+    # Normalize to 0-255 in place
+    windowed -= img_min
+    windowed *= 255.0 / (img_max - img_min)
 
     return windowed.astype(np.uint8)
 
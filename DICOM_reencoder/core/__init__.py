@@ -14,7 +14,8 @@ can rely on the same implementations.
 
 from .datasets import ensure_pixel_data, load_dataset, save_dataset
 from .factories import build_synthetic_series
-from .images import calculate_statistics, frame_to_png_bytes, get_frame, window_frame
+from .images import (calculate_statistics, frame_to_png_bytes, frame_to_raw_png_bytes, frame_to_webp_bytes,
+                     get_frame, window_frame)
 from .metadata import summarize_metadata
 from .network import VerificationServer, send_c_echo
 
@@ -26,6 +27,8 @@ __all__ = [
     "build_synthetic_series",
     "calculate_statistics",
     "frame_to_png_bytes",
+    "frame_to_raw_png_bytes",
+    "frame_to_webp_bytes",
     "get_frame",
     "window_frame",
     "summarize_metadata",
@@ -9,16 +9,22 @@
 """Dataset I/O helpers used across the toolkit."""
 
 from pathlib import Path
-from typing import Union
+from typing import Optional, Union
 
 import pydicom
 from pydicom.dataset import Dataset
 
 
-def load_dataset(path: Union[str, Path], *, force: bool = True) -> Dataset:
-    """Load a DICOM dataset from disk."""
+def load_dataset(path: Union[str, Path], *, force: bool = True,
+                 defer_size: Optional[Union[int, str]] = None) -> Dataset:
+    """
+    Load a DICOM dataset from disk.
+
+    ``defer_size`` (e.g. ``"1 KB"``) leaves larger values, pixel data above
+    all, on disk until they are accessed; the elements stay present.
+    """
     # `force=True` allows us to open partially non-compliant files without failing early
-    return pydicom.dcmread(str(path), force=force)
+    return pydicom.dcmread(str(path), force=force, defer_size=defer_size)
 
 
 def save_dataset(dataset: Dataset, path: Union[str, Path]) -> Path:
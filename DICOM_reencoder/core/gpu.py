@@ -0,0 +1,153 @@
+#
+# gpu.py
+# Dicom-Tools-py
+#
+# Reads uncompressed pixel data straight into GPU memory for statistics and windowing.
+#
+# Thales Matheus Mendonça Santos - November 2025
+
+"""Optional GPU path for native grayscale pixel data, using kvikio and CuPy."""
+
+from pathlib import Path
+from typing import Optional, Union
+
+import numpy as np
+from pydicom.dataset import Dataset
+
+try:
+    # Optional: both are needed, kvikio for file-to-GPU reads and CuPy for the math
+    import cupy as cp
+    import kvikio
+except ImportError:  # pragma: no cover - GPU stack is an optional accelerator
+    cp = None
+    kvikio = None
+
+try:
+    from pydicom.pixels.utils import get_nr_frames, pixel_dtype
+except ImportError:  # pydicom < 3.0
+    from pydicom.pixel_data_handlers.util import get_nr_frames, pixel_dtype
+
+from .images import _add_derived_statistics, _tag_window
+
+_PERCENTILES = (1, 5, 25, 50, 75, 95, 99)
+
+
+def gpu_available() -> bool:
+    """Return True when kvikio and CuPy are installed and a CUDA device is visible."""
+    if cp is None or kvikio is None:
+        return False
+    try:
+        return cp.cuda.runtime.getDeviceCount() > 0
+    except cp.cuda.runtime.CUDARuntimeError:
+        return False
+
+
+def supports_gpu(dataset: Dataset) -> bool:
+    """
+    Return True if the GPU path can handle this dataset.
+
+    Pixel data must be native little-endian grayscale with at most a linear
+    rescale, so the raw bytes can be reinterpreted on the device as they are.
+    """
+    transfer_syntax = getattr(dataset, "file_meta", Dataset()).get("TransferSyntaxUID")
+    if transfer_syntax is None or transfer_syntax.is_compressed or transfer_syntax.is_deflated:
+        return False
+    if not transfer_syntax.is_little_endian or "PixelData" not in dataset:
+        return False
+    return (dataset.get("SamplesPerPixel", 1) == 1
+            and dataset.get("BitsAllocated") in (8, 16, 32)
+            and "ModalityLUTSequence" not in dataset
+            and "VOILUTSequence" not in dataset)
+
+
+def load_frames_gpu(path: Union[str, Path], dataset: Dataset, frame_index: Optional[int] = None):
+    """
+    Read the pixel data of ``path`` into GPU memory.
+
+    Returns every frame as a (frames, rows, cols) array, or just one (rows,
+    cols) frame when ``frame_index`` is given. ``dataset`` must be that file's
+    header parsed with a ``defer_size`` small enough to leave PixelData
+    unread; only its offset in the file is used.
+    """
+    element = dataset.get_item("PixelData", keep_deferred=True)
+    dtype = pixel_dtype(dataset)
+    frames = int(get_nr_frames(dataset))
+    frame_shape = (dataset.Rows, dataset.Columns)
+    frame_size = dataset.Rows * dataset.Columns * dtype.itemsize
+
+    offset = element.value_tell
+    if frame_index is None:
+        shape, size = (frames, *frame_shape), frames * frame_size
+    else:
+        if frame_index >= frames:
+            raise IndexError(f"Frame {frame_index} out of range for {frames} frames")
+        shape, size = frame_shape, frame_size
+        offset += frame_index * frame_size
+
+    buffer = cp.empty(size, dtype=cp.uint8)
+    with kvikio.CuFile(str(path), "r") as f:
+        # Bytes go from storage to device memory without a host-side copy where GDS is available
+        read = f.read(buffer, size, offset)
+    if read != size:
+        raise ValueError(f"Pixel data is truncated: expected {size} bytes, read {read}")
+    return buffer.view(dtype).reshape(shape)
+
+
+def gpu_statistics(frame) -> dict:
+    """calculate_statistics for a CuPy array; only the scalars are copied back to the host."""
+    flat = frame.ravel()
+    percentiles = cp.percentile(flat, list(_PERCENTILES)).get().tolist()
+    stats = {
+        "min": int(flat.min()),
+        "max": int(flat.max()),
+        "mean": float(flat.mean()),
+        "median": percentiles[3],
+        "std": float(flat.std()),
+        "variance": float(flat.var()),
+        "p1": percentiles[0],
+        "p5": percentiles[1],
+        "p25": percentiles[2],
+        "p75": percentiles[4],
+        "p95": percentiles[5],
+        "p99": percentiles[6],
+        "total_pixels": int(flat.size),
+        "unique_values": int(cp.unique(flat).size),
+        "zero_pixels": int(cp.count_nonzero(flat == 0)),
+    }
+    return _add_derived_statistics(stats)
+
+
+def gpu_window_frame(dataset: Dataset, frame) -> np.ndarray:
+    """
+    window_frame for a CuPy frame, returning the 8-bit image on the host.
+
+    The rescale, window, clip and scale run in place on one float32 device
+    buffer; only the final uint8 plane is copied back.
+    """
+    values = frame.astype(cp.float32)
+    slope = float(dataset.get("RescaleSlope", 1))
+    intercept = float(dataset.get("RescaleIntercept", 0))
+    if slope != 1:
+        values *= slope
+    if intercept:
+        values += intercept
+
+    window = _tag_window(dataset)
+    if window is None:
+        p5, median, p95 = cp.percentile(values, [5, 50, 95]).get().tolist()
+        width = p95 - p5
+        if width <= 0:
+            width = float(values.max() - values.min()) or 1.0
+        window = (median, width)
+    center, width = window
+    low, high = center - width // 2, center + width // 2
+    span = max(high - low, 1)
+
+    # MONOCHROME1 stores darker pixels as higher values, so measure from `high` instead
+    if dataset.get("PhotometricInterpretation") == "MONOCHROME1":
+        cp.subtract(high, values, out=values)
+    else:
+        values -= low
+    cp.clip(values, 0, span, out=values)
+    values *= 255.0 / span
+    return values.astype(cp.uint8).get()
@@ -16,6 +16,19 @@ from PIL import Image
 import pydicom
 from pydicom.dataset import Dataset
 
+try:
+    from pydicom.pixels import apply_modality_lut, apply_voi_lut
+except ImportError:  # pydicom < 3.0
+    from pydicom.pixel_data_handlers.util import apply_modality_lut, apply_voi_lut
+
+try:
+    # Optional: parallel JIT histogram for the statistics fast path
+    import numba
+    from numba import prange
+except ImportError:  # pragma: no cover - numba is an optional accelerator
+    numba = None
+    prange = range
+
 
 def get_frame(dataset: Dataset, frame_index: int = 0) -> np.ndarray:
     """Return a single frame from a dataset, handling multi-frame safely."""
@@ -28,28 +41,141 @@ def get_frame(dataset: Dataset, frame_index: int = 0) -> np.ndarray:
     return np.asarray(pixels)
 
 
+def _histogram_kernel(flat: np.ndarray, offset: int, size: int, chunks: int) -> np.ndarray:
+    # Each chunk fills its own row, so parallel iterations never write to the same counter
+    hist = np.zeros((chunks, size), dtype=np.int64)
+    step = (flat.size + chunks - 1) // chunks
+    for chunk in prange(chunks):
+        for i in range(chunk * step, min((chunk + 1) * step, flat.size)):
+            hist[chunk, flat[i] - offset] += 1
+    return hist.sum(axis=0)
+
+
+if numba is not None:
+    _histogram_kernel = numba.njit(parallel=True, nogil=True, cache=True)(_histogram_kernel)
+
+
+def _small_int_histogram(flat_pixels: np.ndarray) -> tuple[np.ndarray, int]:
+    """Count every value of 8/16-bit integer data; returns (counts, value of counts[0])."""
+    info = np.iinfo(flat_pixels.dtype)
+    offset, size = int(info.min), int(info.max) - int(info.min) + 1
+    if numba is not None:
+        return _histogram_kernel(flat_pixels, offset, size, numba.get_num_threads()), offset
+    if offset:
+        return np.bincount(flat_pixels.astype(np.intp) - offset, minlength=size), offset
+    return np.bincount(flat_pixels, minlength=size), offset
+
+
+def _histogram_percentile(values: np.ndarray, cumulative: np.ndarray, q: float) -> float:
+    """Percentile from the distinct values present and their cumulative counts."""
+    # Same linear interpolation between closest ranks that np.percentile uses by default
+    total = int(cumulative[-1])
+    position = q / 100.0 * (total - 1)
+    lower = int(position)
+    low_value, high_value = values[np.searchsorted(cumulative, [lower, min(lower + 1, total - 1)], side="right")]
+    return float(low_value + (high_value - low_value) * (position - lower))
+
+
+def _percentiles(flat: np.ndarray, qs: tuple[float, ...]) -> list[float]:
+    """np.percentile(flat, qs) in linear time: one histogram for 8/16-bit data, else np.partition."""
+    dtype = flat.dtype
+    if dtype.kind in "iu" and dtype.itemsize <= 2 and dtype.isnative:
+        counts, offset = _small_int_histogram(flat)
+        present = np.flatnonzero(counts)
+        values = present.astype(np.float64) + offset
+        cumulative = np.cumsum(counts[present])
+        return [_histogram_percentile(values, cumulative, q) for q in qs]
+
+    positions = [q / 100.0 * (flat.size - 1) for q in qs]
+    ranks = sorted({rank for position in positions
+                    for rank in (int(position), min(int(position) + 1, flat.size - 1))})
+    # Partitioning places just the needed ranks, instead of sorting the whole array; those
+    # are the only entries the interpolation reads
+    return _sorted_percentiles(np.partition(flat, ranks), qs)
+
+
+def _sorted_percentiles(ordered: np.ndarray, qs: tuple[float, ...]) -> list[float]:
+    """np.percentile(ordered, qs) for already-sorted data: the ranks are read directly."""
+    results = []
+    for q in qs:
+        position = q / 100.0 * (ordered.size - 1)
+        lower = int(position)
+        low_value = float(ordered[lower])
+        high_value = float(ordered[min(lower + 1, ordered.size - 1)])
+        results.append(low_value + (high_value - low_value) * (position - lower))
+    return results
+
+
+def _histogram_statistics(flat_pixels: np.ndarray) -> dict:
+    """Derive the statistics from a single counting pass instead of one pass per metric."""
+    counts, offset = _small_int_histogram(flat_pixels)
+    present = np.flatnonzero(counts)
+    values = present.astype(np.float64) + offset
+    weights = counts[present]
+    cumulative = np.cumsum(weights)
+    total = int(cumulative[-1])
+
+    mean = float(np.dot(values, weights) / total)
+    variance = float(np.dot((values - mean) ** 2, weights) / total)
+
+    def percentile(q: float) -> float:
+        return _histogram_percentile(values, cumulative, q)
+
+    zero_index = -offset
+    return {
+        "min": int(values[0]),
+        "max": int(values[-1]),
+        "mean": mean,
+        "median": percentile(50),
+        "std": float(np.sqrt(variance)),
+        "variance": variance,
+        "p1": percentile(1),
+        "p5": percentile(5),
+        "p25": percentile(25),
+        "p75": percentile(75),
+        "p95": percentile(95),
+        "p99": percentile(99),
+        "total_pixels": total,
+        "unique_values": int(len(present)),
+        "zero_pixels": int(counts[zero_index]),
+    }
+
+
 def calculate_statistics(pixel_array: np.ndarray) -> dict:
     """Compute descriptive statistics for a pixel array."""
-    flat_pixels = np.asarray(pixel_array).flatten()
-
-    stats = {
-        "min": int(np.min(flat_pixels)),
-        "max": int(np.max(flat_pixels)),
-        "mean": float(np.mean(flat_pixels)),
-        "median": float(np.median(flat_pixels)),
-        "std": float(np.std(flat_pixels)),
-        "variance": float(np.var(flat_pixels)),
-        "p1": float(np.percentile(flat_pixels, 1)),
-        "p5": float(np.percentile(flat_pixels, 5)),
-        "p25": float(np.percentile(flat_pixels, 25)),
-        "p75": float(np.percentile(flat_pixels, 75)),
-        "p95": float(np.percentile(flat_pixels, 95)),
-        "p99": float(np.percentile(flat_pixels, 99)),
-        "total_pixels": int(len(flat_pixels)),
-        "unique_values": int(len(np.unique(flat_pixels))),
-        "zero_pixels": int(np.sum(flat_pixels == 0)),
-    }
+    flat_pixels = np.asarray(pixel_array).ravel()
+
+    dtype = flat_pixels.dtype
+    if dtype.kind in "iu" and dtype.itemsize <= 2 and dtype.isnative and flat_pixels.size:
+        # 8/16-bit data has at most 65536 distinct values; one histogram gives every statistic
+        stats = _histogram_statistics(flat_pixels)
+    else:
+        # One sort serves min/max, every percentile and the distinct-value count, and the
+        # moments come from a single fused pass, instead of a separate pass per metric
+        ordered = np.sort(flat_pixels)
+        p1, p5, p25, median, p75, p95, p99 = _sorted_percentiles(ordered, (1, 5, 25, 50, 75, 95, 99))
+        moments = moment_statistics(flat_pixels)
+        stats = {
+            "min": int(ordered[0]),
+            "max": int(ordered[-1]),
+            "mean": moments["mean"],
+            "median": median,
+            "std": moments["std"],
+            "variance": moments["std"] ** 2,
+            "p1": p1,
+            "p5": p5,
+            "p25": p25,
+            "p75": p75,
+            "p95": p95,
+            "p99": p99,
+            "total_pixels": int(flat_pixels.size),
+            "unique_values": int(np.count_nonzero(ordered[1:] != ordered[:-1])) + 1,
+            "zero_pixels": int(np.count_nonzero(flat_pixels == 0)),
+        }
+    return _add_derived_statistics(stats)
+
 
+def _add_derived_statistics(stats: dict) -> dict:
     stats["range"] = stats["max"] - stats["min"]
     stats["iqr"] = stats["p75"] - stats["p25"]
     # Guard against divide-by-zero when all pixels are zero
@@ -57,51 +183,234 @@ def calculate_statistics(pixel_array: np.ndarray) -> dict:
     return stats
 
 
-def _derive_window(dataset: Dataset, frame: np.ndarray) -> tuple[int, int]:
-    """Determine window center/width using DICOM tags or histogram heuristics."""
+# Elements per chunk for the NumPy moments fallback; small enough to stay in cache
+_MOMENTS_CHUNK = 1 << 16
+
+
+def _moments_kernel(flat: np.ndarray, shift: float) -> tuple[float, float, float, float]:
+    # Sums are taken around `shift` (the first value) to limit cancellation in the variance
+    total = 0.0
+    total_sq = 0.0
+    low = flat[0]
+    high = flat[0]
+    for i in prange(flat.size):
+        value = flat[i]
+        delta = value - shift
+        total += delta
+        total_sq += delta * delta
+        low = min(low, value)
+        high = max(high, value)
+    return total, total_sq, low, high
+
+
+if numba is not None:
+    _moments_kernel = numba.njit(parallel=True, nogil=True, cache=True)(_moments_kernel)
+
+
+def moment_statistics(array: np.ndarray) -> dict:
+    """Min, max, mean and (population) std of an array in one pass over memory."""
+    # Order "K" keeps Fortran-ordered volumes (and their memmaps) as views instead of copying them
+    flat = np.asarray(array).ravel(order="K")
+    if not flat.size:
+        raise ValueError("Cannot compute statistics of an empty array")
+
+    if numba is not None and flat.dtype.kind in "iuf" and flat.dtype.isnative:
+        shift = float(flat[0])
+        total, total_sq, low, high = _moments_kernel(flat, shift)
+        mean = total / flat.size
+        variance = max(total_sq / flat.size - mean * mean, 0.0)
+        return {"min": float(low), "max": float(high), "mean": mean + shift, "std": float(np.sqrt(variance))}
+
+    # Walk cache-sized chunks, merging per-chunk moments (Chan et al.) so memory is read once
+    count = 0
+    mean = 0.0
+    m2 = 0.0
+    low = high = None
+    for start in range(0, flat.size, _MOMENTS_CHUNK):
+        chunk = flat[start:start + _MOMENTS_CHUNK].astype(np.float64)
+        chunk_mean = float(chunk.mean())
+        chunk_m2 = float(np.dot(chunk - chunk_mean, chunk - chunk_mean))
+        chunk_low, chunk_high = float(chunk.min()), float(chunk.max())
+
+        chunk_count = chunk.size
+        delta = chunk_mean - mean
+        combined = count + chunk_count
+        mean += delta * chunk_count / combined
+        m2 += chunk_m2 + delta * delta * count * chunk_count / combined
+        count = combined
+        low = chunk_low if low is None else min(low, chunk_low)
+        high = chunk_high if high is None else max(high, chunk_high)
+
+    return {"min": low, "max": high, "mean": mean, "std": float(np.sqrt(m2 / count))}
+
+
+def _tag_window(dataset: Dataset) -> Optional[tuple[float, float]]:
+    """Return the first WindowCenter/WindowWidth pair from the tags, if present."""
     wc = dataset.get("WindowCenter")
     ww = dataset.get("WindowWidth")
+    if wc is None or ww is None:
+        return None
+    if isinstance(wc, pydicom.multival.MultiValue):
+        wc = wc[0]
+    if isinstance(ww, pydicom.multival.MultiValue):
+        ww = ww[0]
+    return float(wc), float(max(1, ww))
 
-    if wc is not None and ww is not None:
-        if isinstance(wc, pydicom.multival.MultiValue):
-            wc = float(wc[0])
-        if isinstance(ww, pydicom.multival.MultiValue):
-            ww = float(ww[0])
-        return int(wc), int(max(1, ww))
 
-    # Fallback: use robust percentiles
-    center = float(np.median(frame))
-    width = float(np.percentile(frame, 95) - np.percentile(frame, 5))
-    width = width if width > 0 else float(np.max(frame) - np.min(frame) or 1)
-    return int(center), int(width)
+def _derive_window(dataset: Dataset, frame: np.ndarray) -> tuple[float, float]:
+    """Determine window center/width using DICOM tags or histogram heuristics."""
+    window = _tag_window(dataset)
+    if window is not None:
+        return window
+
+    # Fallback: robust percentiles, found in linear time rather than by sorting
+    p5, median, p95 = _percentiles(np.asarray(frame).ravel(), (5, 50, 95))
+    width = p95 - p5
+    if width <= 0:
+        width = float(np.max(frame) - np.min(frame)) or 1.0
+    return median, width
 
 
-def window_frame(dataset: Dataset, frame_index: int = 0, *, window_center: Optional[int] = None,
-                 window_width: Optional[int] = None) -> np.ndarray:
-    """Apply windowing and return an 8-bit image suitable for PNG export."""
-    frame = get_frame(dataset, frame_index)
+def _scale_to_uint8(values: np.ndarray, low: float, high: float, *, invert: bool = False) -> np.ndarray:
+    # One float32 working buffer, updated in place: shift, clip to [low, high], scale to 0..255.
+    # Inverting measures from `high` instead of `low`, so it costs no extra pass.
+    span = max(high - low, 1)
+    buffer = np.empty(values.shape, dtype=np.float32)
+    if invert:
+        np.subtract(high, values, out=buffer, dtype=np.float32)
+    else:
+        np.subtract(values, low, out=buffer, dtype=np.float32)
+    np.clip(buffer, 0, span, out=buffer)
+    buffer *= np.float32(255.0 / span)
+    return buffer.astype(np.uint8)
+
+
+def _lut_auto_window(stored: np.ndarray, table: np.ndarray, unsigned: np.dtype) -> tuple[float, float]:
+    # _derive_window's percentile fallback, taken from a histogram of the stored values mapped
+    # through the modality table: sorting at most 65536 distinct values replaces a pass over
+    # the rescaled frame (the sort also covers a negative RescaleSlope)
+    counts, offset = _small_int_histogram(stored.ravel())
+    present = np.flatnonzero(counts)
+    mapped = table[(present + offset).astype(stored.dtype).view(unsigned)].astype(np.float64)
+    order = np.argsort(mapped, kind="stable")
+    values = mapped[order]
+    cumulative = np.cumsum(counts[present][order])
+    p5, median, p95 = (_histogram_percentile(values, cumulative, q) for q in (5, 50, 95))
+    width = p95 - p5
+    if width <= 0:
+        width = float(values[-1] - values[0]) or 1.0
+    return median, width
+
+
+def _window_through_lut(dataset: Dataset, stored: np.ndarray, window_center: Optional[float],
+                        window_width: Optional[float], *, invert: bool) -> np.ndarray:
+    """window_frame for 8/16-bit data: window every possible stored value once, then gather."""
+    unsigned = np.dtype(f"u{stored.dtype.itemsize}")
+    # Every representable stored value, in bit-pattern order so signed pixels index by their
+    # unsigned view and the lookup needs no offset pass
+    domain = np.arange(1 << (8 * unsigned.itemsize), dtype=unsigned).view(stored.dtype)
+    table = apply_modality_lut(domain, dataset)
+
     center, width = window_center, window_width
     if center is None or width is None:
-        # If no manual window is supplied, derive one from tags or pixel statistics
+        center, width = _tag_window(dataset) or _lut_auto_window(stored, table, unsigned)
+    lut = _scale_to_uint8(table, center - width // 2, center + width // 2, invert=invert)
+    return np.take(lut, stored.view(unsigned))
+
+
+def window_frame(dataset: Dataset, frame_index: int = 0, *, window_center: Optional[float] = None,
+                 window_width: Optional[float] = None) -> np.ndarray:
+    """
+    Apply windowing and return an 8-bit image suitable for PNG export.
+
+    Stored values first go through the Modality LUT (RescaleSlope/Intercept or
+    a Modality LUT Sequence), so windows are in output units such as HU. A VOI
+    LUT Sequence is applied as-is unless a manual window is supplied.
+    """
+    stored = get_frame(dataset, frame_index)
+    # MONOCHROME1 stores darker pixels as higher values, so invert for display
+    invert = dataset.get("PhotometricInterpretation") == "MONOCHROME1"
+    center, width = window_center, window_width
+    manual = center is not None and width is not None
+    if not manual and "VOILUTSequence" in dataset:
+        frame = apply_modality_lut(stored, dataset)
+        lut_output = apply_voi_lut(frame, dataset, prefer_lut=True)
+        return _scale_to_uint8(lut_output, float(np.min(lut_output)), float(np.max(lut_output)),
+                               invert=invert)
+
+    dtype = stored.dtype
+    if dtype.kind in "iu" and dtype.itemsize <= 2 and dtype.isnative and stored.size >= 1 << (8 * dtype.itemsize):
+        # Windowing is a per-value function: once the frame has more pixels than there are
+        # possible values, a lookup table beats the arithmetic over every pixel
+        return _window_through_lut(dataset, np.ascontiguousarray(stored), center, width, invert=invert)
+
+    frame = apply_modality_lut(stored, dataset)
+    if not manual:
+        # If no manual window is supplied, derive one from tags or the pixel range
         center, width = _derive_window(dataset, frame)
 
-    img_min = center - width // 2
-    img_max = center + width // 2
-    windowed = np.clip(frame, img_min, img_max)
-    scaled = ((windowed - img_min) / max(img_max - img_min, 1) * 255.0).astype(np.uint8)
+    return _scale_to_uint8(frame, center - width // 2, center + width // 2, invert=invert)
 
-    if dataset.get("PhotometricInterpretation") == "MONOCHROME1":
-        # MONOCHROME1 stores darker pixels as higher values, so invert for display
-        scaled = 255 - scaled
 
-    return scaled
+def _fit_width(image: Image.Image, max_width: Optional[int]) -> Image.Image:
+    # Integer box reduction: averages whole pixel blocks (area resampling) in one cheap pass
+    if max_width and image.width > max_width:
+        return image.reduce(-(-image.width // max_width))
+    return image
 
 
-def frame_to_png_bytes(dataset: Dataset, frame_index: int = 0, *, window_center: Optional[int] = None,
-                       window_width: Optional[int] = None) -> BytesIO:
-    """Convert a DICOM frame into PNG bytes."""
+def _encode_frame(dataset: Dataset, frame_index: int, window_center: Optional[float],
+                  window_width: Optional[float], max_width: Optional[int], image_format: str,
+                  **params) -> BytesIO:
     image = Image.fromarray(window_frame(dataset, frame_index, window_center=window_center, window_width=window_width))
     buffer = BytesIO()
-    image.save(buffer, format="PNG")
+    _fit_width(image, max_width).save(buffer, format=image_format, **params)
     buffer.seek(0)
     return buffer
+
+
+def frame_to_png_bytes(dataset: Dataset, frame_index: int = 0, *, window_center: Optional[float] = None,
+                       window_width: Optional[float] = None, compress_level: int = 6,
+                       max_width: Optional[int] = None) -> BytesIO:
+    """
+    Convert a DICOM frame into PNG bytes; a lower ``compress_level`` trades size for speed.
+
+    Frames wider than ``max_width`` are box-reduced by an integer factor until they fit.
+    """
+    return _encode_frame(dataset, frame_index, window_center, window_width, max_width, "PNG",
+                         compress_level=compress_level)
+
+
+def frame_to_webp_bytes(dataset: Dataset, frame_index: int = 0, *, window_center: Optional[float] = None,
+                        window_width: Optional[float] = None, quality: int = 80,
+                        max_width: Optional[int] = None) -> BytesIO:
+    """Convert a DICOM frame into lossy WebP bytes with the fastest encoder setting, for previews."""
+    return _encode_frame(dataset, frame_index, window_center, window_width, max_width, "WEBP",
+                         quality=quality, method=0)
+
+
+def frame_to_raw_png_bytes(dataset: Dataset, frame_index: int = 0, *,
+                           compress_level: int = 1) -> tuple[BytesIO, int]:
+    """
+    Encode a grayscale frame's stored values losslessly as an 8- or 16-bit PNG.
+
+    No LUTs or windowing are applied, so the client can window the full range
+    itself. PNG samples are unsigned: signed data is shifted up by the returned
+    offset, i.e. ``stored = png_value - offset``.
+    """
+    if dataset.get("SamplesPerPixel", 1) != 1:
+        raise ValueError("Raw previews are only available for single-channel images")
+    frame = np.ascontiguousarray(get_frame(dataset, frame_index))
+    if frame.dtype.kind not in "iu" or frame.dtype.itemsize > 2:
+        raise ValueError(f"Raw previews need 8/16-bit integer pixels, not {frame.dtype}")
+
+    offset = 0
+    if frame.dtype.kind == "i":
+        # Flipping the sign bit maps the signed range onto the unsigned one in a single pass
+        offset = 1 << (8 * frame.dtype.itemsize - 1)
+        frame = frame.view(f"u{frame.dtype.itemsize}") ^ offset
+    image = Image.fromarray(frame)
+    buffer = BytesIO()
+    image.save(buffer, format="PNG", compress_level=compress_level)
+    buffer.seek(0)
+    return buffer, offset
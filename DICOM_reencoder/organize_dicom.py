@@ -16,6 +16,7 @@ creating a logical folder structure for better file management.
 import pydicom
 import sys
 import os
+import mmap
 import shutil
 import glob
 import argparse
@@ -52,6 +53,31 @@ def sanitize_filename(name):
     # Fall back to a predictable placeholder when nothing remains
     return name if name else 'Unknown'
 
+def read_header(file_path, tags):
+    """
+    Read only the requested header tags from a DICOM file.
+
+    The file is memory-mapped so the kernel only faults in the pages pydicom
+    actually touches; with stop_before_pixels the pixel data is never paged in.
+
+    Args:
+        file_path: Path to DICOM file
+        tags: Keywords of the tags needed by the caller
+
+    Returns:
+        Dataset containing the requested tags (if present)
+    """
+    with open(file_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            # Empty files cannot be mapped; let pydicom report the problem as usual
+            return pydicom.dcmread(f, stop_before_pixels=True, force=True, specific_tags=tags)
+
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            return pydicom.dcmread(mm, stop_before_pixels=True, force=True, specific_tags=tags)
+        finally:
+            mm.close()
+
 def organize_by_patient(source_dir, dest_dir, copy_mode=False, recursive=False):
     """
     Organize DICOM files by patient.
@@ -73,7 +99,7 @@ def organize_by_patient(source_dir, dest_dir, copy_mode=False, recursive=False):
     for file_path in files:
         try:
             # Skip reading heavy pixel buffers; we only need header tags to sort files
-            dataset = pydicom.dcmread(file_path, stop_before_pixels=True, force=True)
+            dataset = read_header(file_path, ['PatientName', 'PatientID'])
 
             patient_name = sanitize_filename(dataset.get('PatientName', 'Unknown'))
             patient_id = sanitize_filename(dataset.get('PatientID', 'Unknown'))
@@ -121,7 +147,7 @@ def organize_by_study(source_dir, dest_dir, copy_mode=False, recursive=False):
 
     for file_path in files:
         try:
-            dataset = pydicom.dcmread(file_path, stop_before_pixels=True, force=True)
+            dataset = read_header(file_path, ['PatientName', 'StudyDate', 'StudyDescription'])
 
             patient_name = sanitize_filename(dataset.get('PatientName', 'Unknown'))
             study_date = sanitize_filename(dataset.get('StudyDate', 'Unknown'))
@@ -171,7 +197,8 @@ def organize_by_series(source_dir, dest_dir, copy_mode=False, recursive=False):
 
     for file_path in files:
         try:
-            dataset = pydicom.dcmread(file_path, stop_before_pixels=True, force=True)
+            dataset = read_header(file_path, ['PatientName', 'StudyDate', 'SeriesNumber',
+                                              'SeriesDescription', 'InstanceNumber'])
 
             patient_name = sanitize_filename(dataset.get('PatientName', 'Unknown'))
             study_date = sanitize_filename(dataset.get('StudyDate', 'Unknown'))
@@ -238,7 +265,7 @@ def organize_by_modality(source_dir, dest_dir, copy_mode=False, recursive=False)
 
     for file_path in files:
         try:
-            dataset = pydicom.dcmread(file_path, stop_before_pixels=True, force=True)
+            dataset = read_header(file_path, ['Modality', 'PatientName'])
 
             modality = sanitize_filename(dataset.get('Modality', 'Unknown'))
             patient_name = sanitize_filename(dataset.get('PatientName', 'Unknown'))
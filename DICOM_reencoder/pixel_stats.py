@@ -21,7 +21,13 @@ import numpy as np
 
 from .core.images import calculate_statistics
 
-def display_statistics(input_file, frame_number=0, show_histogram=False):
+# Widest integer value range counted with np.bincount (covers any 16-bit image)
+_BINCOUNT_MAX_SPAN = 1 << 16
+
+# Element values larger than this (bytes) are read lazily when comparing files
+_DEFER_SIZE = 1024
+
+def display_statistics(input_file, frame_number=0, show_histogram=False, raw=False):
     """
     Display pixel data statistics for a DICOM file.
 
@@ -29,6 +35,7 @@ def display_statistics(input_file, frame_number=0, show_histogram=False):
         input_file: Path to DICOM file
         frame_number: Frame number for multi-frame images (0-based)
         show_histogram: Whether to show histogram
+        raw: Skip colour-space conversion (e.g. YBR to RGB) when decoding pixels
     """
     try:
         # Read the DICOM file
@@ -39,6 +46,11 @@ def display_statistics(input_file, frame_number=0, show_histogram=False):
             print("Error: No pixel data found in DICOM file.")
             return
 
+        if raw and hasattr(dataset, 'pixel_array_options'):
+            # pydicom >= 3.0 can hand back the stored colour planes as-is; the
+            # distribution statistics do not need the YBR -> RGB conversion
+            dataset.pixel_array_options(raw=True)
+
         # Get pixel array
         pixel_array = dataset.pixel_array
         # Accessing pixel_array triggers decompression; do it once and reuse the result
@@ -132,6 +144,25 @@ def display_statistics(input_file, frame_number=0, show_histogram=False):
         import traceback
         traceback.print_exc()
 
+def _integer_histogram(flat_pixels, bins):
+    """
+    Histogram integer pixels by counting each value once, then binning the counts.
+
+    Gives the same result as np.histogram on the raw pixels but only makes a
+    single linear pass over the image (np.bincount) instead of binning every pixel.
+    Returns None when the value range is too wide for a dense count table.
+    """
+    min_value = int(flat_pixels.min())
+    span = int(flat_pixels.max()) - min_value + 1
+    if span > _BINCOUNT_MAX_SPAN:
+        return None
+
+    # Shift to zero so signed data (e.g. CT Hounsfield units) can be counted too
+    counts = np.bincount(flat_pixels.astype(np.intp) - min_value, minlength=span)
+    values = np.nonzero(counts)[0]
+    hist, bin_edges = np.histogram(values + min_value, bins=bins, weights=counts[values])
+    return hist.astype(np.int64), bin_edges
+
 def display_histogram(pixel_array, bins=20):
     """
     Display a text-based histogram of pixel values.
@@ -140,14 +171,19 @@ def display_histogram(pixel_array, bins=20):
         pixel_array: NumPy array of pixel data
         bins: Number of histogram bins
     """
-    flat_pixels = pixel_array.flatten()
+    flat_pixels = pixel_array.ravel()
 
     # Calculate histogram
-    hist, bin_edges = np.histogram(flat_pixels, bins=bins)
+    result = None
+    if np.issubdtype(flat_pixels.dtype, np.integer):
+        result = _integer_histogram(flat_pixels, bins)
+    hist, bin_edges = result if result is not None else np.histogram(flat_pixels, bins=bins)
 
     # Find max count for scaling
     max_count = np.max(hist)
+    total = len(flat_pixels)
     bar_width = 50  # Width of the histogram bars
+    full_bar = '█' * bar_width
 
     # Display histogram
     for i in range(len(hist)):
@@ -161,11 +197,21 @@ def display_histogram(pixel_array, bins=20):
         else:
             bar_len = 0
 
-        bar = '█' * bar_len
-        percentage = (count / len(flat_pixels)) * 100
+        bar = full_bar[:bar_len]
+        percentage = (count / total) * 100
 
         print(f"  [{bin_start:8.1f} - {bin_end:8.1f}]: {bar:<{bar_width}} {count:8,} ({percentage:5.2f}%)")
 
+def _absolute_difference(px1, px2):
+    """|px2 - px1| in one buffer: int32 for integer data of 16 bits or fewer, else float64."""
+    small_ints = all(px.dtype.kind in 'iu' and px.dtype.itemsize <= 2 for px in (px1, px2))
+    # Subtract straight into the buffer and take abs in place, instead of materialising
+    # two widened copies plus a separate absolute-difference array
+    abs_diff = np.empty(px1.shape, dtype=np.int32 if small_ints else np.float64)
+    np.subtract(px2, px1, out=abs_diff, dtype=abs_diff.dtype, casting='unsafe')
+    np.absolute(abs_diff, out=abs_diff)
+    return abs_diff
+
 def compare_pixel_stats(file1, file2):
     """
     Compare pixel statistics between two DICOM files.
@@ -179,9 +225,10 @@ def compare_pixel_stats(file1, file2):
         print(f"Pixel Statistics Comparison")
         print(f"{'='*80}\n")
 
-        # Read both files
-        ds1 = pydicom.dcmread(file1, force=True)
-        ds2 = pydicom.dcmread(file2, force=True)
+        # Read both files; large values (ICC profiles, overlays, private blobs) are
+        # deferred and only loaded from disk if something actually accesses them
+        ds1 = pydicom.dcmread(file1, force=True, defer_size=_DEFER_SIZE)
+        ds2 = pydicom.dcmread(file2, force=True, defer_size=_DEFER_SIZE)
 
         if 'PixelData' not in ds1 or 'PixelData' not in ds2:
             print("Error: One or both files do not contain pixel data.")
@@ -223,18 +270,21 @@ def compare_pixel_stats(file1, file2):
 
         # Check if pixel data is identical
         if px1.shape == px2.shape:
-            if np.array_equal(px1, px2):
+            # Exact comparison in the stored dtypes; a widened difference can hide
+            # sub-integer float changes or wrap around for 32-bit data
+            diff_pixels = np.count_nonzero(px1 != px2)
+
+            if diff_pixels == 0:
                 print(f"\n✓ Pixel data is IDENTICAL")
             else:
-                diff_pixels = np.sum(px1 != px2)
                 diff_percent = (diff_pixels / px1.size) * 100
                 print(f"\n✗ Pixel data is DIFFERENT")
                 print(f"  Different pixels: {diff_pixels:,} ({diff_percent:.2f}%)")
 
                 # Calculate difference metrics
-                abs_diff = np.abs(px2.astype(np.int32) - px1.astype(np.int32))
-                print(f"  Mean absolute difference: {np.mean(abs_diff):.2f}")
-                print(f"  Max absolute difference: {np.max(abs_diff)}")
+                abs_diff = _absolute_difference(px1, px2)
+                print(f"  Mean absolute difference: {abs_diff.mean():.2f}")
+                print(f"  Max absolute difference: {abs_diff.max()}")
         else:
             print(f"\n⚠ Images have different dimensions, cannot compare pixel values")
 
@@ -258,6 +308,9 @@ Examples:
   # Analyze specific frame of multi-frame image
   %(prog)s multiframe.dcm --frame 5
 
+  # Skip YBR -> RGB conversion for colour images
+  %(prog)s color.dcm --raw
+
   # Compare two files
   %(prog)s file1.dcm --compare file2.dcm
         '''
@@ -272,13 +325,15 @@ Examples:
                         help='Number of histogram bins (default: 20)')
     parser.add_argument('-c', '--compare', metavar='FILE',
                         help='Compare pixel statistics with another file')
+    parser.add_argument('--raw', action='store_true',
+                        help='Analyze stored pixel values without colour-space conversion')
 
     args = parser.parse_args()
 
     if args.compare:
         compare_pixel_stats(args.input_file, args.compare)
     else:
-        display_statistics(args.input_file, args.frame, args.histogram)
+        display_statistics(args.input_file, args.frame, args.histogram, args.raw)
 
     return 0
 
@@ -7,32 +7,143 @@
 #
 # Thales Matheus Mendonça Santos - November 2025
 
+import argparse
+import os
+import shutil
 import sys
+from multiprocessing import Pool
+
 import pydicom
+from pydicom.errors import InvalidDicomError
+from pydicom.filereader import read_file_meta_info
 from pydicom.uid import ExplicitVRLittleEndian
 
-def main():
-    input_file = "1.dcm"
-    output_file = "1_reencoded.dcm"
-    
-    if len(sys.argv) > 1:
-        input_file = sys.argv[1]
-    if len(sys.argv) > 2:
-        output_file = sys.argv[2]
+from .batch_process import find_dicom_files
 
-    print(f"Reading {input_file}...")
+def reencode_file(input_file, output_file, target_ts=ExplicitVRLittleEndian):
+    """
+    Rewrite a DICOM file so it advertises ``target_ts``.
+
+    Args:
+        input_file: Path to the source DICOM file
+        output_file: Path for the rewritten file (may equal ``input_file``)
+        target_ts: Transfer Syntax UID to write (default: Explicit VR Little Endian)
+
+    Returns:
+        True if the file was re-encoded, False if it already used the target syntax
+    """
     try:
-        dataset = pydicom.dcmread(input_file, force=True)
-    except FileNotFoundError:
-        print(f"Error: File {input_file} not found.")
-        sys.exit(1)
+        file_meta = read_file_meta_info(input_file)
+    except InvalidDicomError:
+        # No preamble/file meta; only a full parse with force=True can handle it
+        file_meta = None
 
-    # Force the dataset to advertise Explicit VR Little Endian so downstream tools can parse it
-    dataset.file_meta.TransferSyntaxUID = ExplicitVRLittleEndian
+    source_ts = file_meta.get('TransferSyntaxUID') if file_meta is not None else None
+    if source_ts == target_ts:
+        # Nothing to convert: leave in-place targets untouched, otherwise a byte copy will do
+        if not (os.path.exists(output_file) and os.path.samefile(input_file, output_file)):
+            shutil.copyfile(input_file, output_file)
+        return False
+
+    dataset = pydicom.dcmread(input_file, force=True)
+
+    # Force the dataset to advertise the target syntax so downstream tools can parse it
+    dataset.file_meta.TransferSyntaxUID = target_ts
 
     # Save as new file
     dataset.save_as(output_file)
-    print(f"File rewritten with TransferSyntaxUID={ExplicitVRLittleEndian} in '{output_file}'")
+    return True
+
+def _reencode_job(job):
+    # Pool worker: report failures back instead of raising so one bad file doesn't stop the batch
+    input_file, output_file, target_ts = job
+    try:
+        return input_file, reencode_file(input_file, output_file, target_ts), None
+    except Exception as e:
+        return input_file, False, str(e)
+
+def reencode_directory(input_dir, output_dir, recursive=False, workers=None,
+                       target_ts=ExplicitVRLittleEndian):
+    """
+    Re-encode every DICOM file in a directory using a process pool.
+
+    Args:
+        input_dir: Directory containing DICOM files
+        output_dir: Directory for the rewritten files (mirrors the input layout)
+        recursive: Search for DICOM files recursively
+        workers: Number of worker processes (default: CPU count)
+        target_ts: Transfer Syntax UID to write (default: Explicit VR Little Endian)
+
+    Returns:
+        Tuple of (success_count, skipped_count, error_count)
+    """
+    files = find_dicom_files(input_dir, recursive)
+    jobs = []
+    for file_path in files:
+        output_path = os.path.join(output_dir, os.path.relpath(file_path, input_dir))
+        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+        jobs.append((file_path, output_path, target_ts))
+
+    print(f"Re-encoding {len(jobs)} files from {input_dir} into {output_dir}...")
+
+    success_count = 0
+    skipped_count = 0
+    error_count = 0
+    if jobs:
+        # Each file is independent, so spread the parse/write cost across cores
+        with Pool(workers or os.cpu_count()) as pool:
+            for file_path, rewritten, error in pool.imap_unordered(_reencode_job, jobs, chunksize=8):
+                if error:
+                    print(f"  ✗ {file_path}: {error}")
+                    error_count += 1
+                elif rewritten:
+                    success_count += 1
+                else:
+                    skipped_count += 1
+
+    print(f"Re-encoding complete: {success_count} successful, {skipped_count} already "
+          f"in target syntax, {error_count} errors")
+    return success_count, skipped_count, error_count
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Rewrite DICOM files with Explicit VR Little Endian',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog='''
+Examples:
+  %(prog)s image.dcm image_reencoded.dcm
+  %(prog)s /path/to/dicoms /path/to/output -r
+        '''
+    )
+    parser.add_argument('input', nargs='?', default='1.dcm',
+                        help='Input DICOM file or directory (default: 1.dcm)')
+    parser.add_argument('output', nargs='?',
+                        help='Output file or directory (default: 1_reencoded.dcm, '
+                             'or <input>_reencoded for a directory)')
+    parser.add_argument('-r', '--recursive', action='store_true',
+                        help='Search input directory recursively')
+    parser.add_argument('-j', '--workers', type=int,
+                        help='Worker processes for directory input (default: CPU count)')
+
+    args = parser.parse_args()
+
+    if os.path.isdir(args.input):
+        output_dir = args.output or f"{args.input.rstrip(os.sep)}_reencoded"
+        _, _, error_count = reencode_directory(args.input, output_dir, args.recursive, args.workers)
+        sys.exit(1 if error_count else 0)
+
+    input_file = args.input
+    output_file = args.output or "1_reencoded.dcm"
+
+    print(f"Reading {input_file}...")
+    if not os.path.exists(input_file):
+        print(f"Error: File {input_file} not found.")
+        sys.exit(1)
+
+    if reencode_file(input_file, output_file):
+        print(f"File rewritten with TransferSyntaxUID={ExplicitVRLittleEndian} in '{output_file}'")
+    else:
+        print("File is already Explicit VR Little Endian; nothing to re-encode")
 
 if __name__ == "__main__":
     main()
@@ -19,9 +19,212 @@ import os
 import glob
 import re
 import argparse
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from functools import partial
+from itertools import chain, islice
+from pydicom.tag import Tag
 
-def search_dicom_files(directory, criteria, recursive=False, output_format='table'):
+# Extra columns shown for every match, so they are always read from the header
+DISPLAY_TAGS = ['Modality', 'StudyDate']
+
+# Below this many files the scan runs in-process; a pool would cost more than it saves
+PARALLEL_MIN_FILES = 64
+
+def _match_substring(needle, value):
+    return needle in value.lower()
+
+def _match_prefix(prefix, value):
+    return value.lower().startswith(prefix)
+
+def compile_criteria(criteria):
+    """
+    Compile search criteria once so they can be applied to many files.
+
+    Each criterion becomes a single matcher callable, so the per-file loop makes
+    one call per tag instead of re-dispatching on the kind of pattern. Matchers
+    are regex methods or partials of module-level functions, so they pickle to
+    worker processes.
+
+    Args:
+        criteria: Dictionary of search criteria {tag: value}
+
+    Returns:
+        List of (keyword, tag, matcher) tuples where tag is the resolved numeric
+        tag (None if the keyword is unknown) and matcher(value) returns a truthy
+        result when the stringified tag value matches
+    """
+    compiled = []
+    for keyword, search_value in criteria.items():
+        # Resolve the keyword here so the per-file loop indexes the dataset by tag directly
+        try:
+            tag = Tag(keyword)
+        except ValueError:
+            tag = None
+
+        literal = search_value.strip('*')
+        if '*' in search_value and '*' not in literal and re.escape(literal) == literal:
+            # Simple wildcards need no regex: the pattern is only anchored at the start,
+            # so "Doe*" is a prefix test and "*Doe" / "*Doe*" are substring tests
+            if search_value.startswith('*'):
+                matcher = partial(_match_substring, literal.lower())
+            else:
+                matcher = partial(_match_prefix, literal.lower())
+        elif '*' in search_value:
+            # Wildcard matching (anchored at the start, like re.match)
+            matcher = re.compile(search_value.replace('*', '.*'), re.IGNORECASE).match
+        elif search_value.startswith('/') and search_value.endswith('/'):
+            # Regex matching
+            matcher = re.compile(search_value[1:-1], re.IGNORECASE).search
+        else:
+            # Exact or substring matching
+            matcher = partial(_match_substring, search_value.lower())
+        compiled.append((keyword, tag, matcher))
+    return compiled
+
+def header_tags(keywords):
+    """
+    Resolve the tags a search needs so only those elements are parsed.
+
+    Args:
+        keywords: Tag keywords (or numeric tag strings) used by the search
+
+    Returns:
+        List of tags suitable for dcmread(specific_tags=...)
+    """
+    tags = []
+    for keyword in keywords:
+        try:
+            tags.append(Tag(keyword))
+        except ValueError:
+            # Unknown keywords can never be present in a dataset, so there is nothing to read
+            continue
+    return tags
+
+def looks_like_dicom(f):
+    """
+    Cheaply check whether an open binary file can be a DICOM file.
+
+    Accepts the 'DICM' magic after the preamble, or a preamble-less dataset
+    starting with a group 0002/0008 element (which force=True reads). The file
+    position is left at the start.
+    """
+    head = f.read(132)
+    f.seek(0)
+    if head[128:132] == b'DICM':
+        return True
+    return head[:2] in (b'\x02\x00', b'\x08\x00')
+
+def _sniff_dicom(file_path):
+    """looks_like_dicom() for a path; unreadable files are not DICOM candidates."""
+    try:
+        with open(file_path, 'rb') as f:
+            return looks_like_dicom(f)
+    except OSError:
+        return False
+
+def read_header(file_path, tags):
+    """
+    Read only the given tags from a DICOM file, stopping before pixel data.
+
+    Returns:
+        Dataset, or None if the file does not look like DICOM at all
+    """
+    with open(file_path, 'rb') as f:
+        # A byte compare rejects non-DICOM files before pydicom starts parsing and raising
+        if not looks_like_dicom(f):
+            return None
+        return pydicom.dcmread(f, stop_before_pixels=True, force=True, specific_tags=tags)
+
+def scan_directory(directory):
+    """
+    Yield DICOM candidates in a single directory.
+
+    .dcm files are taken as-is; other files are included only if they pass the
+    same looks_like_dicom() sniff read_header applies, so preamble-less DICOM
+    files are found while other files never reach pydicom.
+    """
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            # Match glob('*') semantics: hidden entries are ignored
+            if entry.name.startswith('.') or not entry.is_file():
+                continue
+            if entry.name.endswith('.dcm') or _sniff_dicom(entry.path):
+                yield entry.path
+
+def walk_directory(directory):
+    """
+    Yield .dcm files anywhere below a directory.
+
+    os.walk is built on scandir, so file/directory checks come from the directory
+    entries themselves instead of one stat() call per entry as glob('**') does.
+    """
+    for root, dirs, files in os.walk(directory):
+        # Match glob('**') semantics: hidden files and directories are ignored
+        dirs[:] = [name for name in dirs if not name.startswith('.')]
+        for name in files:
+            if name.endswith('.dcm') and not name.startswith('.'):
+                yield os.path.join(root, name)
+
+def _check_file(file_path, compiled_criteria, needed_tags):
+    """
+    Match one file against compiled criteria.
+
+    Module-level so it can run in worker processes.
+
+    Returns:
+        Tuple of (file_path, display data) where display data is None if the file does not match
+    """
+    try:
+        # Load header only; skipping pixel buffers keeps the search fast
+        dataset = read_header(file_path, needed_tags)
+        if dataset is None:
+            return file_path, None
+
+        # Each tag value is stringified once and reused for the display row
+        file_data = {}
+
+        # Check if all criteria match
+        for keyword, tag, matcher in compiled_criteria:
+            elem = dataset.get(tag) if tag is not None else None
+            if elem is None:
+                return file_path, None
+
+            file_value = file_data[keyword] = str(elem.value)
+            if not matcher(file_value):
+                return file_path, None
+
+        # Collect data for display
+        file_data['file'] = os.path.basename(file_path)
+
+        # Add some additional useful fields
+        for tag in DISPLAY_TAGS:
+            if tag not in file_data:
+                file_data[tag] = str(dataset.get(tag, 'N/A'))
+
+        return file_path, file_data
+
+    except Exception:
+        # Silently skip files that can't be read
+        return file_path, None
+
+def _map_files(func, files, workers=None):
+    """
+    Lazily apply func to every file, in order, using a process pool for larger batches.
+
+    Header parsing is CPU-bound, so separate processes let it scale across cores;
+    small batches stay in-process where pool start-up would dominate. ``files``
+    may be any iterable, so directory enumeration and parsing overlap.
+    """
+    files = iter(files)
+    head = list(islice(files, PARALLEL_MIN_FILES))
+    if workers == 1 or len(head) < PARALLEL_MIN_FILES:
+        yield from map(func, chain(head, files))
+        return
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from executor.map(func, chain(head, files), chunksize=32)
+
+def search_dicom_files(directory, criteria, recursive=False, output_format='table', workers=None):
     """
     Search for DICOM files matching criteria.
 
@@ -30,6 +233,7 @@ def search_dicom_files(directory, criteria, recursive=False, output_format='tabl
         criteria: Dictionary of search criteria {tag: value}
         recursive: Search recursively
         output_format: Output format ('table', 'list', 'csv')
+        workers: Worker processes for the scan (default: CPU count)
 
     Returns:
         List of matching files
@@ -45,76 +249,34 @@ def search_dicom_files(directory, criteria, recursive=False, output_format='tabl
         print(f"  {tag}: {value}")
     print(f"\n{'─'*80}\n")
 
-    # Find all DICOM files
-    pattern = '**/*.dcm' if recursive else '*.dcm'
-    all_files = glob.glob(os.path.join(directory, pattern), recursive=recursive)
-
-    # Also check files without extension
-    if not recursive:
-        for file_path in glob.glob(os.path.join(directory, '*')):
-            if os.path.isfile(file_path) and not file_path.endswith('.dcm'):
-                try:
-                    # Try to sniff header information without loading pixel data
-                    pydicom.dcmread(file_path, stop_before_pixels=True, force=True)
-                    all_files.append(file_path)
-                except:
-                    pass
-
-    print(f"Found {len(all_files)} DICOM files to search\n")
+    # Enumerate DICOM files lazily; they are parsed as the directory walk proceeds
+    if recursive:
+        all_files = walk_directory(directory)
+    else:
+        all_files = scan_directory(directory)
 
     matching_files = []
     matched_data = []
 
-    for file_path in all_files:
-        try:
-            # Load header only; skipping pixel buffers keeps the search fast
-            dataset = pydicom.dcmread(file_path, stop_before_pixels=True, force=True)
-
-            # Check if all criteria match
-            match = True
-            for tag, search_value in criteria.items():
-                if tag not in dataset:
-                    match = False
-                    break
-
-                file_value = str(dataset.get(tag, ''))
-
-                # Support wildcard and regex matching
-                if '*' in search_value:
-                    # Wildcard matching
-                    pattern = search_value.replace('*', '.*')
-                    if not re.match(pattern, file_value, re.IGNORECASE):
-                        match = False
-                        break
-                elif search_value.startswith('/') and search_value.endswith('/'):
-                    # Regex matching
-                    regex = search_value[1:-1]
-                    if not re.search(regex, file_value, re.IGNORECASE):
-                        match = False
-                        break
-                else:
-                    # Exact or substring matching
-                    if search_value.lower() not in file_value.lower():
-                        match = False
-                        break
-
-            if match:
-                matching_files.append(file_path)
-
-                # Collect data for display
-                file_data = {'file': os.path.basename(file_path)}
-                for tag in criteria.keys():
-                    file_data[tag] = str(dataset.get(tag, 'N/A'))
-
-                # Add some additional useful fields
-                file_data['Modality'] = str(dataset.get('Modality', 'N/A'))
-                file_data['StudyDate'] = str(dataset.get('StudyDate', 'N/A'))
-
-                matched_data.append(file_data)
-
-        except Exception as e:
-            # Silently skip files that can't be read
-            pass
+    # Patterns are compiled once here rather than for every file
+    try:
+        compiled_criteria = compile_criteria(criteria)
+    except re.error as e:
+        print(f"Error: Invalid search pattern: {e}")
+        return []
+
+    # Only the searched and displayed tags are parsed; every other element is skipped
+    needed_tags = header_tags(list(criteria.keys()) + DISPLAY_TAGS)
+
+    searched_count = 0
+    check = partial(_check_file, compiled_criteria=compiled_criteria, needed_tags=needed_tags)
+    for file_path, file_data in _map_files(check, all_files, workers):
+        searched_count += 1
+        if file_data is not None:
+            matching_files.append(file_path)
+            matched_data.append(file_data)
+
+    print(f"Searched {searched_count} DICOM files\n")
 
     # Display results
     print(f"{'='*80}")
@@ -216,7 +378,25 @@ def search_by_study(directory, study_desc=None, study_date=None, modality=None,
 
     return search_dicom_files(directory, criteria, recursive)
 
-def search_by_date_range(directory, start_date, end_date, recursive=False):
+def _check_study_date(file_path, start, end):
+    """Return (file_path, StudyDate) if the study date falls in [start, end], else (file_path, None)."""
+    try:
+        dataset = read_header(file_path, ['StudyDate'])
+        if dataset is None:
+            return file_path, None
+        study_date_str = str(dataset.get('StudyDate', ''))
+
+        if study_date_str and len(study_date_str) == 8:
+            study_date = datetime.strptime(study_date_str, '%Y%m%d')
+
+            if start <= study_date <= end:
+                return file_path, study_date
+
+    except Exception:
+        pass
+    return file_path, None
+
+def search_by_date_range(directory, start_date, end_date, recursive=False, workers=None):
     """
     Search for files within a date range.
 
@@ -225,14 +405,17 @@ def search_by_date_range(directory, start_date, end_date, recursive=False):
         start_date: Start date (YYYYMMDD)
         end_date: End date (YYYYMMDD)
         recursive: Search recursively
+        workers: Worker processes for the scan (default: CPU count)
     """
     print(f"\nSearching DICOM files by date range...")
     print(f"Directory: {directory}")
     print(f"Date range: {start_date} to {end_date}")
     print(f"{'='*80}\n")
 
-    pattern = '**/*.dcm' if recursive else '*.dcm'
-    all_files = glob.glob(os.path.join(directory, pattern), recursive=recursive)
+    if recursive:
+        all_files = walk_directory(directory)
+    else:
+        all_files = glob.iglob(os.path.join(directory, '*.dcm'))
 
     matching_files = []
 
@@ -244,20 +427,11 @@ def search_by_date_range(directory, start_date, end_date, recursive=False):
         print("Error: Dates must be in YYYYMMDD format")
         return []
 
-    for file_path in all_files:
-        try:
-            dataset = pydicom.dcmread(file_path, stop_before_pixels=True, force=True)
-            study_date_str = str(dataset.get('StudyDate', ''))
-
-            if study_date_str and len(study_date_str) == 8:
-                study_date = datetime.strptime(study_date_str, '%Y%m%d')
-
-                if start <= study_date <= end:
-                    matching_files.append(file_path)
-                    print(f"  ✓ {os.path.basename(file_path)} - {study_date.strftime('%Y-%m-%d')}")
-
-        except Exception as e:
-            pass
+    check = partial(_check_study_date, start=start, end=end)
+    for file_path, study_date in _map_files(check, all_files, workers):
+        if study_date is not None:
+            matching_files.append(file_path)
+            print(f"  ✓ {os.path.basename(file_path)} - {study_date.strftime('%Y-%m-%d')}")
 
     print(f"\n{'='*80}")
     print(f"Found {len(matching_files)} files in date range")
@@ -303,6 +477,8 @@ Regex Matching:
                         help='Search recursively')
     parser.add_argument('--format', choices=['table', 'list', 'csv'], default='table',
                         help='Output format (default: table)')
+    parser.add_argument('-j', '--workers', type=int,
+                        help='Worker processes for scanning files (default: CPU count)')
 
     # Patient search
     parser.add_argument('--patient-name', help='Patient name to search')
@@ -325,7 +501,8 @@ Regex Matching:
 
     # Date range search
     if args.date_range:
-        search_by_date_range(args.directory, args.date_range[0], args.date_range[1], args.recursive)
+        search_by_date_range(args.directory, args.date_range[0], args.date_range[1], args.recursive,
+                             args.workers)
         return 0
 
     # Build criteria dictionary
@@ -361,7 +538,7 @@ Regex Matching:
         return 1
 
     # Perform search
-    search_dicom_files(args.directory, criteria, args.recursive, args.format)
+    search_dicom_files(args.directory, criteria, args.recursive, args.format, args.workers)
 
     return 0
 
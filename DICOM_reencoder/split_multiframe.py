@@ -17,10 +17,196 @@ import pydicom
 import sys
 import os
 import argparse
+import multiprocessing
 import numpy as np
+from collections import deque
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+from itertools import islice
+from pydicom.encaps import encapsulate
 from pydicom.uid import generate_uid, ExplicitVRLittleEndian
 
-def split_multiframe(input_file, output_dir=None, prefix=None):
+try:
+    from pydicom.encaps import generate_frames
+except ImportError:  # pydicom < 3.0
+    from pydicom.encaps import generate_pixel_data_frame
+
+    def generate_frames(buffer, *, number_of_frames=None):
+        return generate_pixel_data_frame(buffer, nr_frames=number_of_frames)
+
+# Threads overlapping per-frame file writes, and how many encoded frames may wait on them
+WRITE_THREADS = 4
+MAX_PENDING_WRITES = 32
+
+# Below this many frames, encoding stays in-process; forking workers would cost more than it saves
+PARALLEL_MIN_FRAMES = 64
+
+# Split state inherited by forked workers (copy-on-write), so nothing is pickled per frame
+_FORK_STATE = None
+
+class _LazyFrames(Sequence):
+    """Random-access frame bytes, produced on demand by a per-index function."""
+
+    def __init__(self, get_frame, num_frames):
+        self._get_frame = get_frame
+        self._num_frames = num_frames
+
+    def __len__(self):
+        return self._num_frames
+
+    def __getitem__(self, frame_idx):
+        if not 0 <= frame_idx < self._num_frames:
+            raise IndexError(frame_idx)
+        return self._get_frame(frame_idx)
+
+def is_encapsulated(dataset):
+    """Return True if the dataset's pixel data is stored compressed (encapsulated)."""
+    transfer_syntax = dataset.file_meta.get('TransferSyntaxUID') if hasattr(dataset, 'file_meta') else None
+    return bool(transfer_syntax and transfer_syntax.is_compressed)
+
+def iter_frame_bytes(dataset, num_frames):
+    """
+    Return each frame's pixel bytes, without decoding the whole pixel array.
+
+    Compressed frames are yielded as their encoded bitstream, ready to be
+    re-encapsulated. Native frames are sliced straight out of PixelData.
+    Bit-packed or big endian data falls back to decoding via pixel_array.
+    Native and decoded frames come back as a lazy random-access sequence;
+    compressed frames as an iterator. The source pixel data is captured up
+    front, so the dataset's header may be modified while frames are consumed.
+
+    Args:
+        dataset: Multi-frame dataset with PixelData
+        num_frames: Number of frames in the dataset
+    """
+    if is_encapsulated(dataset):
+        return generate_frames(dataset.PixelData, number_of_frames=num_frames)
+
+    transfer_syntax = dataset.file_meta.get('TransferSyntaxUID') if hasattr(dataset, 'file_meta') else None
+    bits_allocated = int(dataset.get('BitsAllocated', 8))
+    big_endian = bool(transfer_syntax) and not transfer_syntax.is_little_endian
+    if bits_allocated % 8 or big_endian:
+        pixel_array = dataset.pixel_array
+        return _LazyFrames(lambda frame_idx: pixel_array[frame_idx].tobytes(), num_frames)
+
+    frame_size = (int(dataset.Rows) * int(dataset.Columns) *
+                  int(dataset.get('SamplesPerPixel', 1)) * (bits_allocated // 8))
+    # Frames are contiguous in PixelData; slicing a memoryview does not copy, so the
+    # only copy per frame is the bytes() handed to the output dataset
+    view = memoryview(dataset.PixelData)
+    return _LazyFrames(lambda frame_idx: bytes(view[frame_idx * frame_size:(frame_idx + 1) * frame_size]),
+                       num_frames)
+
+def _prepare_frame_template(dataset, encapsulated):
+    """
+    Turn a multi-frame dataset into a single-frame template, in place.
+
+    Everything that is the same for every output frame is patched once here;
+    the per-frame loop only swaps pixel data and instance identifiers.
+    """
+    # The offsets described the multi-frame stream, not a single frame; malformed
+    # files may carry either element without the other
+    for keyword in ('ExtendedOffsetTable', 'ExtendedOffsetTableLengths'):
+        dataset.pop(keyword, None)
+
+    # Update NumberOfFrames (should be 1 for single frame)
+    if 'NumberOfFrames' in dataset:
+        dataset.NumberOfFrames = 1
+
+    if hasattr(dataset, 'file_meta') and not encapsulated:
+        # Native frames are written uncompressed
+        dataset.file_meta.TransferSyntaxUID = ExplicitVRLittleEndian
+    return dataset
+
+def _set_frame(template, frame_bytes, encapsulated, instance_number):
+    # Patch the per-frame fields; save_as serializes immediately so the template can be reused
+    template.PixelData = encapsulate([frame_bytes]) if encapsulated else frame_bytes
+    template.InstanceNumber = instance_number
+
+    # Generate new SOP Instance UID for each frame
+    template.SOPInstanceUID = generate_uid()
+    if hasattr(template, 'file_meta'):
+        template.file_meta.MediaStorageSOPInstanceUID = template.SOPInstanceUID
+
+def _encode_dataset(dataset):
+    # Serialize to bytes now; the template is modified again for the next frame
+    buffer = BytesIO()
+    dataset.save_as(buffer)
+    return buffer.getvalue()
+
+def _write_file(output_file, data):
+    with open(output_file, 'wb') as f:
+        f.write(data)
+
+def _frame_name_formatter(prefix):
+    # Output names differ only by frame number, so the pattern is built once per split
+    escaped = prefix.replace('{', '{{').replace('}', '}}')
+    return f"{escaped}_frame_{{:04d}}.dcm".format
+
+def _emit_frame(frame_idx):
+    # Forked worker: patch this process's copy of the template, encode and write one frame
+    template, frames, encapsulated, output_root, frame_name = _FORK_STATE
+    file_name = frame_name(frame_idx + 1)
+    try:
+        _set_frame(template, frames[frame_idx], encapsulated, frame_idx + 1)
+        template.save_as(output_root + file_name)
+        return frame_idx, file_name, None
+    except Exception as e:
+        return frame_idx, file_name, str(e)
+
+def _split_forked(template, frames, encapsulated, output_root, frame_name, num_frames, workers):
+    """Encode and write frames in forked worker processes that share the loaded dataset."""
+    global _FORK_STATE
+    if not isinstance(frames, Sequence):
+        # Workers pick frames by index; compressed streams are small enough to hold as a list
+        frames = list(frames)
+
+    _FORK_STATE = (template, frames, encapsulated, output_root, frame_name)
+    try:
+        with multiprocessing.get_context('fork').Pool(workers) as pool:
+            for frame_idx, file_name, error in pool.imap(_emit_frame, range(num_frames), chunksize=16):
+                if error:
+                    print(f"  ✗ Error processing frame {frame_idx+1}: {error}")
+                else:
+                    print(f"  ✓ Frame {frame_idx+1:4d}/{num_frames} -> {file_name}")
+    finally:
+        _FORK_STATE = None
+
+def _split_threaded(template, frames, encapsulated, output_root, frame_name, num_frames):
+    """Encode frames in-process and overlap the file writes on a thread pool."""
+    # Split frames: encode each frame here, hand the disk write to a thread pool
+    pending = deque()
+    with ThreadPoolExecutor(max_workers=WRITE_THREADS) as executor:
+        for frame_idx, frame_bytes in enumerate(frames):
+            try:
+                _set_frame(template, frame_bytes, encapsulated, frame_idx + 1)
+
+                # Create output filename
+                file_name = frame_name(frame_idx + 1)
+
+                # Save the frame
+                future = executor.submit(_write_file, output_root + file_name, _encode_dataset(template))
+                pending.append((frame_idx, file_name, future))
+            except Exception as e:
+                print(f"  ✗ Error processing frame {frame_idx+1}: {e}")
+
+            # Bound the number of encoded frames held in memory at once
+            while len(pending) > MAX_PENDING_WRITES:
+                _report_write(*pending.popleft(), num_frames)
+
+        while pending:
+            _report_write(*pending.popleft(), num_frames)
+
+def _report_write(frame_idx, file_name, future, num_frames):
+    # Wait for a queued write and report it, keeping the output in frame order
+    try:
+        future.result()
+        print(f"  ✓ Frame {frame_idx+1:4d}/{num_frames} -> {file_name}")
+    except Exception as e:
+        print(f"  ✗ Error processing frame {frame_idx+1}: {e}")
+
+def split_multiframe(input_file, output_dir=None, prefix=None, workers=None):
     """
     Split a multi-frame DICOM file into single-frame files.
 
@@ -28,6 +214,7 @@ def split_multiframe(input_file, output_dir=None, prefix=None):
         input_file: Path to input multi-frame DICOM file
         output_dir: Output directory for split files
         prefix: Prefix for output filenames
+        workers: Worker processes for large files (default: CPU count, 1 disables them)
 
     Returns:
         Number of frames created
@@ -42,18 +229,20 @@ def split_multiframe(input_file, output_dir=None, prefix=None):
             print("Error: No pixel data found in DICOM file.")
             return 0
 
-        # Get pixel array
-        pixel_array = dataset.pixel_array
+        # Frame count and size come from the header; pixel data is never fully decoded
+        num_frames = int(dataset.get('NumberOfFrames', 1) or 1)
 
         # Check if it's a multi-frame image
-        if len(pixel_array.shape) <= 2:
+        if num_frames <= 1:
             print("Error: This is a single-frame image, not multi-frame.")
-            print(f"Image dimensions: {pixel_array.shape}")
+            print(f"Image dimensions: {dataset.get('Rows')} x {dataset.get('Columns')}")
             return 0
 
-        num_frames = pixel_array.shape[0]
         print(f"Multi-frame image detected: {num_frames} frames")
-        print(f"Frame dimensions: {pixel_array.shape[1]} x {pixel_array.shape[2]}")
+        print(f"Frame dimensions: {dataset.Rows} x {dataset.Columns}")
+
+        # Compressed frames are copied as-is and keep the source transfer syntax
+        encapsulated = is_encapsulated(dataset)
 
         # Set output directory
         if output_dir is None:
@@ -73,47 +262,25 @@ def split_multiframe(input_file, output_dir=None, prefix=None):
         # Keep track of the original series so the resulting files remain grouped logically
         original_series_uid = dataset.get('SeriesInstanceUID', generate_uid())
 
-        # Split frames
-        for frame_idx in range(num_frames):
-            try:
-                # Clone the header so each output frame retains the original metadata
-                frame_dataset = dataset.copy()
-
-                # Extract this frame's pixel data
-                frame_pixels = pixel_array[frame_idx]
-
-                # Update pixel data
-                frame_dataset.PixelData = frame_pixels.tobytes()
-
-                # Update NumberOfFrames (should be 1 for single frame)
-                if 'NumberOfFrames' in frame_dataset:
-                    frame_dataset.NumberOfFrames = 1
-
-                # Update Instance Number
-                frame_dataset.InstanceNumber = frame_idx + 1
-
-                # Generate new SOP Instance UID for each frame
-                frame_dataset.SOPInstanceUID = generate_uid()
-
-                # Keep the same Series Instance UID so they appear as one series
-                frame_dataset.SeriesInstanceUID = original_series_uid
-
-                # Update file meta information
-                if hasattr(frame_dataset, 'file_meta'):
-                    # Refresh file meta so each slice is self-contained and uncompressed
-                    frame_dataset.file_meta.MediaStorageSOPInstanceUID = frame_dataset.SOPInstanceUID
-                    frame_dataset.file_meta.TransferSyntaxUID = ExplicitVRLittleEndian
+        # Capture the frames first, then reuse the loaded dataset as a single template
+        # instead of copying the whole header for every frame
+        frames = iter_frame_bytes(dataset, num_frames)
+        template = _prepare_frame_template(dataset, encapsulated)
 
-                # Create output filename
-                output_file = os.path.join(output_dir, f"{prefix}_frame_{frame_idx+1:04d}.dcm")
-
-                # Save the frame
-                frame_dataset.save_as(output_file)
+        # Keep the same Series Instance UID so they appear as one series
+        template.SeriesInstanceUID = original_series_uid
 
-                print(f"  ✓ Frame {frame_idx+1:4d}/{num_frames} -> {os.path.basename(output_file)}")
+        output_root = os.path.join(output_dir, '')
+        frame_name = _frame_name_formatter(prefix)
 
-            except Exception as e:
-                print(f"  ✗ Error processing frame {frame_idx+1}: {e}")
+        workers = workers or os.cpu_count() or 1
+        if (workers > 1 and num_frames >= PARALLEL_MIN_FRAMES
+                and 'fork' in multiprocessing.get_all_start_methods()):
+            # Serialization is CPU-bound; forked workers inherit the template and pixel
+            # data copy-on-write, so frames are encoded in parallel without re-parsing
+            _split_forked(template, frames, encapsulated, output_root, frame_name, num_frames, workers)
+        else:
+            _split_threaded(template, frames, encapsulated, output_root, frame_name, num_frames)
 
         print(f"\n{'='*80}")
         print(f"✓ Split complete!")
@@ -137,7 +304,18 @@ def get_frame_info(input_file):
         input_file: Path to DICOM file
     """
     try:
-        dataset = pydicom.dcmread(input_file, force=True)
+        frame_fields = [
+            'NumberOfFrames',
+            'FrameTime',
+            'FrameDelay',
+            'FrameIncrementPointer',
+            'RecommendedDisplayFrameRate'
+        ]
+
+        # Dimensions come from the header, so pixel data is only located (deferred), never read or decoded
+        dataset = pydicom.dcmread(input_file, force=True, defer_size=1024,
+                                  specific_tags=['Rows', 'Columns', 'SamplesPerPixel', 'PixelData']
+                                  + frame_fields)
 
         print(f"\n{'='*80}")
         print(f"Multi-frame DICOM Information")
@@ -148,26 +326,24 @@ def get_frame_info(input_file):
             print("No pixel data found.")
             return
 
-        pixel_array = dataset.pixel_array
+        rows = dataset.Rows
+        columns = dataset.Columns
+        num_frames = int(dataset.get('NumberOfFrames') or 1)
+        samples = dataset.get('SamplesPerPixel', 1)
+
+        # Same layout pixel_array would produce: (frames, rows, columns, samples)
+        shape = (rows, columns) + ((samples,) if samples > 1 else ())
 
-        if len(pixel_array.shape) <= 2:
+        if num_frames <= 1:
             print("This is a single-frame image.")
-            print(f"Dimensions: {pixel_array.shape[1]} x {pixel_array.shape[0]}")
+            print(f"Dimensions: {columns} x {rows}")
         else:
-            num_frames = pixel_array.shape[0]
             print(f"Multi-frame image: {num_frames} frames")
-            print(f"Frame dimensions: {pixel_array.shape[2]} x {pixel_array.shape[1]}")
-            print(f"Total pixel array shape: {pixel_array.shape}")
+            print(f"Frame dimensions: {columns} x {rows}")
+            print(f"Total pixel array shape: {(num_frames,) + shape}")
 
         # Additional frame-related metadata
         print(f"\nFrame Metadata:")
-        frame_fields = [
-            'NumberOfFrames',
-            'FrameTime',
-            'FrameDelay',
-            'FrameIncrementPointer',
-            'RecommendedDisplayFrameRate'
-        ]
 
         for field in frame_fields:
             if field in dataset:
@@ -194,13 +370,12 @@ def extract_specific_frames(input_file, frame_numbers, output_dir=None):
             print("Error: No pixel data found.")
             return 0
 
-        pixel_array = dataset.pixel_array
+        num_frames = int(dataset.get('NumberOfFrames', 1) or 1)
 
-        if len(pixel_array.shape) <= 2:
+        if num_frames <= 1:
             print("Error: This is a single-frame image.")
             return 0
 
-        num_frames = pixel_array.shape[0]
         print(f"\nMulti-frame image: {num_frames} frames")
 
         # Validate frame numbers
@@ -229,27 +404,29 @@ def extract_specific_frames(input_file, frame_numbers, output_dir=None):
         prefix = os.path.splitext(os.path.basename(input_file))[0]
         extracted_count = 0
 
-        for frame_num in valid_frames:
-            frame_idx = frame_num - 1  # Convert to 0-based index
+        # Native and decoded frames are random access; only the encapsulated
+        # stream has to be walked, keeping just the requested frames
+        encapsulated = is_encapsulated(dataset)
+        frames = iter_frame_bytes(dataset, num_frames)
+        if not isinstance(frames, Sequence):
+            wanted = set(valid_frames)
+            frames = {
+                frame_idx: frame_bytes
+                for frame_idx, frame_bytes in enumerate(islice(frames, max(valid_frames)))
+                if frame_idx + 1 in wanted
+            }
+        template = _prepare_frame_template(dataset, encapsulated)
+        output_root = os.path.join(output_dir, '')
+        frame_name = _frame_name_formatter(prefix)
 
+        for frame_num in valid_frames:
             try:
-                frame_dataset = dataset.copy()
-                frame_pixels = pixel_array[frame_idx]
-                frame_dataset.PixelData = frame_pixels.tobytes()
-
-                if 'NumberOfFrames' in frame_dataset:
-                    frame_dataset.NumberOfFrames = 1
-
-                frame_dataset.InstanceNumber = frame_num
-                frame_dataset.SOPInstanceUID = generate_uid()
-
-                if hasattr(frame_dataset, 'file_meta'):
-                    frame_dataset.file_meta.MediaStorageSOPInstanceUID = frame_dataset.SOPInstanceUID
+                _set_frame(template, frames[frame_num - 1], encapsulated, frame_num)
 
-                output_file = os.path.join(output_dir, f"{prefix}_frame_{frame_num:04d}.dcm")
-                frame_dataset.save_as(output_file)
+                file_name = frame_name(frame_num)
+                template.save_as(output_root + file_name)
 
-                print(f"  ✓ Frame {frame_num} -> {os.path.basename(output_file)}")
+                print(f"  ✓ Frame {frame_num} -> {file_name}")
                 extracted_count += 1
 
             except Exception as e:
@@ -295,6 +472,8 @@ Examples:
                         help='Extract only specific frame numbers (1-based)')
     parser.add_argument('--info', action='store_true',
                         help='Show frame information without splitting')
+    parser.add_argument('-j', '--workers', type=int,
+                        help='Worker processes for files with many frames (default: CPU count)')
 
     args = parser.parse_args()
 
@@ -308,7 +487,7 @@ Examples:
         extract_specific_frames(args.input_file, args.frames, args.output_dir)
     else:
         # Split all frames
-        split_multiframe(args.input_file, args.output_dir, args.prefix)
+        split_multiframe(args.input_file, args.output_dir, args.prefix, args.workers)
 
     return 0
 
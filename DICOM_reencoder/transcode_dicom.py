@@ -26,41 +26,42 @@ def _require_gdcm():
     return gdcm
 
 
+# Friendly names mapped to gdcm.TransferSyntax constant names
+_SYNTAX_CONSTANTS = {
+    "explicit": "ExplicitVRLittleEndian",
+    "implicit": "ImplicitVRLittleEndian",
+    "deflated": "DeflatedExplicitVRLittleEndian",
+    "jpeg-lossless": "JPEGLosslessProcess14_1",
+    "jpeg2000-lossless": "JPEG2000Lossless",
+    "rle": "RLELossless",
+}
+
+# gdcm.TransferSyntax objects, built on first use and reused for every later call
+_TS_CACHE: dict = {}
+
+
 def _transfer_syntax(gdcm, name: str):
     name = name.lower()
-    # Map friendly names to gdcm.TransferSyntax constants
-    mapping = {
-        "explicit": gdcm.TransferSyntax(gdcm.TransferSyntax.ExplicitVRLittleEndian),
-        "implicit": gdcm.TransferSyntax(gdcm.TransferSyntax.ImplicitVRLittleEndian),
-        "deflated": gdcm.TransferSyntax(gdcm.TransferSyntax.DeflatedExplicitVRLittleEndian),
-        "jpeg-lossless": gdcm.TransferSyntax(gdcm.TransferSyntax.JPEGLosslessProcess14_1),
-        "jpeg2000-lossless": gdcm.TransferSyntax(gdcm.TransferSyntax.JPEG2000Lossless),
-        "rle": gdcm.TransferSyntax(gdcm.TransferSyntax.RLELossless),
-    }
-    if name not in mapping:
-        options = ", ".join(mapping.keys())
+    if name not in _SYNTAX_CONSTANTS:
+        options = ", ".join(_SYNTAX_CONSTANTS.keys())
         raise SystemExit(f"Unsupported syntax '{name}'. Choose one of: {options}")
-    return mapping[name]
+    if name not in _TS_CACHE:
+        constant = getattr(gdcm.TransferSyntax, _SYNTAX_CONSTANTS[name])
+        _TS_CACHE[name] = gdcm.TransferSyntax(constant)
+    return _TS_CACHE[name]
 
 
-def transcode(input_path: Path, *, output: Path | None = None, syntax: str = "explicit") -> Path:
-    gdcm = _require_gdcm()
-    ts = _transfer_syntax(gdcm, syntax)
-
+def _transcode_file(gdcm, changer, writer, input_path: Path, output_path: Path, syntax: str) -> None:
+    # A fresh reader per file: gdcm readers keep the previously parsed dataset around
     reader = gdcm.ImageReader()
     reader.SetFileName(str(input_path))
     if not reader.Read():
         raise RuntimeError(f"Could not read DICOM file: {input_path}")
 
-    changer = gdcm.ImageChangeTransferSyntax()
-    changer.SetTransferSyntax(ts)
     changer.SetInput(reader.GetImage())
     if not changer.Change():
         raise RuntimeError(f"Failed to transcode {input_path} to {syntax}")
 
-    # Default output adds the target syntax to the filename to avoid overwriting the source
-    output_path = output or input_path.with_name(f"{input_path.stem}_{syntax}.dcm")
-    writer = gdcm.ImageWriter()
     writer.SetFile(reader.GetFile())
     writer.SetFileName(str(output_path))
     writer.SetImage(changer.GetOutput())
@@ -68,20 +69,81 @@ def transcode(input_path: Path, *, output: Path | None = None, syntax: str = "ex
     if not writer.Write():
         raise RuntimeError(f"Failed to write output file: {output_path}")
 
+
+def _default_output(input_path: Path, syntax: str, out_dir: Path | None = None) -> Path:
+    # Default output adds the target syntax to the filename to avoid overwriting the source
+    name = f"{input_path.stem}_{syntax}.dcm"
+    return out_dir / name if out_dir else input_path.with_name(name)
+
+
+def transcode(input_path: Path, *, output: Path | None = None, syntax: str = "explicit") -> Path:
+    gdcm = _require_gdcm()
+    ts = _transfer_syntax(gdcm, syntax)
+
+    changer = gdcm.ImageChangeTransferSyntax()
+    changer.SetTransferSyntax(ts)
+
+    output_path = output or _default_output(input_path, syntax)
+    _transcode_file(gdcm, changer, gdcm.ImageWriter(), input_path, output_path, syntax)
     return output_path
 
 
+def transcode_many(paths, *, out_dir: Path | None = None, syntax: str = "explicit"):
+    """Transcode several files, sharing one changer and writer across all of them.
+
+    Returns a tuple of (written output paths, list of (input path, error message)).
+    """
+    gdcm = _require_gdcm()
+    ts = _transfer_syntax(gdcm, syntax)
+
+    # Set up the GDCM pipeline once; only the input and output change per file
+    changer = gdcm.ImageChangeTransferSyntax()
+    changer.SetTransferSyntax(ts)
+    writer = gdcm.ImageWriter()
+
+    if out_dir:
+        out_dir.mkdir(parents=True, exist_ok=True)
+
+    written = []
+    failures = []
+    for input_path in paths:
+        input_path = Path(input_path)
+        output_path = _default_output(input_path, syntax, out_dir)
+        try:
+            _transcode_file(gdcm, changer, writer, input_path, output_path, syntax)
+            written.append(output_path)
+        except RuntimeError as exc:
+            failures.append((input_path, str(exc)))
+    return written, failures
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(description="Transcode DICOM transfer syntax using GDCM")
-    parser.add_argument("input", help="Input DICOM file")
-    parser.add_argument("-o", "--output", help="Output DICOM file (default: <name>_<syntax>.dcm)")
+    parser.add_argument("input", help="Input DICOM file (or directory with --batch)")
+    parser.add_argument("-o", "--output",
+                        help="Output DICOM file, or output directory with --batch "
+                             "(default: <name>_<syntax>.dcm next to each input)")
     parser.add_argument("--syntax", default="explicit",
                         help="Target syntax: explicit, implicit, deflated, jpeg-lossless, jpeg2000-lossless, rle")
+    parser.add_argument("--batch", action="store_true",
+                        help="Transcode every .dcm file in the input directory")
     args = parser.parse_args()
 
     input_path = Path(args.input)
     output_path = Path(args.output) if args.output else None
 
+    if args.batch:
+        if not input_path.is_dir():
+            raise SystemExit(f"--batch expects a directory: {input_path}")
+        written, failures = transcode_many(sorted(input_path.glob("*.dcm")), out_dir=output_path,
+                                           syntax=args.syntax)
+        for failed_path, message in failures:
+            print(f"Transcode failed for {failed_path}: {message}")
+        print(f"Transcoded {len(written)} files ({len(failures)} failed)")
+        if failures:
+            raise SystemExit(1)
+        return
+
     try:
         result = transcode(input_path, output=output_path, syntax=args.syntax)
         print(f"Transcoded file written to: {result}")
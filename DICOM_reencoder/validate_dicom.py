@@ -13,24 +13,136 @@ This script checks DICOM files for proper structure, required tags,
 and data integrity.
 """
 
-from typing import Optional
+import argparse
+import io
+import re
+import warnings
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import redirect_stdout
+from functools import lru_cache
+from typing import Iterable, Optional
 
 import pydicom
 import sys
 import os
+from pydicom.tag import Tag
+
+try:
+    from pydicom.pixels.utils import get_expected_length, get_nr_frames, pixel_dtype
+except ImportError:  # pydicom < 3.0
+    from pydicom.pixel_data_handlers.util import get_expected_length, get_nr_frames, pixel_dtype
+
+# Every dataset element the header checks look at; the rest of the tag stream is skipped
+_VALIDATE_TAGS = [
+    'SOPClassUID', 'SOPInstanceUID', 'StudyInstanceUID', 'SeriesInstanceUID', 'Modality',
+    'PatientName', 'PatientID',
+    'StudyDate', 'StudyTime', 'SeriesDate', 'SeriesTime',
+    'ContentDate', 'ContentTime', 'AcquisitionDate', 'AcquisitionTime',
+    'Rows', 'Columns', 'BitsAllocated', 'BitsStored', 'HighBit', 'PixelRepresentation',
+    'PhotometricInterpretation', 'NumberOfFrames', 'SamplesPerPixel', 'PixelData',
+]
+
+# Checked elements as (keyword, description, tag); tags are resolved once so each
+# check is a single dataset lookup without keyword resolution
+_REQUIRED_ELEMENTS = tuple((keyword, description, Tag(keyword)) for keyword, description in (
+    ('SOPClassUID', 'SOP Class UID'),
+    ('SOPInstanceUID', 'SOP Instance UID'),
+    ('StudyInstanceUID', 'Study Instance UID'),
+    ('SeriesInstanceUID', 'Series Instance UID'),
+    ('Modality', 'Modality'),
+))
+_TYPE2_ELEMENTS = tuple((keyword, description, Tag(keyword)) for keyword, description in (
+    ('PatientName', 'Patient Name'),
+    ('PatientID', 'Patient ID'),
+    ('StudyDate', 'Study Date'),
+    ('StudyTime', 'Study Time'),
+))
+_FILE_META_TAGS = tuple((keyword, Tag(keyword)) for keyword in (
+    # Minimal set of tags required by Part 10 to describe the encapsulated dataset
+    'FileMetaInformationGroupLength',
+    'FileMetaInformationVersion',
+    'MediaStorageSOPClassUID',
+    'MediaStorageSOPInstanceUID',
+    'TransferSyntaxUID',
+))
+_PIXEL_ATTRIBUTE_TAGS = tuple((keyword, Tag(keyword)) for keyword in
+                              ('Rows', 'Columns', 'BitsAllocated', 'BitsStored',
+                               'HighBit', 'PixelRepresentation', 'PhotometricInterpretation'))
+_UID_TAGS = tuple((keyword, Tag(keyword)) for keyword in
+                  ('SOPInstanceUID', 'StudyInstanceUID', 'SeriesInstanceUID'))
+_DATE_TAGS = tuple((keyword, Tag(keyword)) for keyword in
+                   ('StudyDate', 'SeriesDate', 'ContentDate', 'AcquisitionDate'))
+_TIME_TAGS = tuple((keyword, Tag(keyword)) for keyword in
+                   ('StudyTime', 'SeriesTime', 'ContentTime', 'AcquisitionTime'))
+
+# Translation table that deletes every character allowed in a UID
+_UID_ALLOWED_DELETE = str.maketrans('', '', '0123456789.')
+
+# Format checks compiled once and run entirely inside the regex engine
+_UID_PATTERN = re.compile(r'[0-9]+(?:\.[0-9]+)*')
+_DATE_PATTERN = re.compile(r'(?:19[0-9]{2}|20[0-9]{2}|2100)(?:0[1-9]|1[0-2])(?:0[1-9]|[12][0-9]|3[01])')
+_TIME_HOUR_PATTERN = re.compile(r'[01][0-9]|2[0-3]')
+
+@lru_cache(maxsize=4096)
+def _uid_name(uid):
+    """Registry name of a UID; the same few SOP classes repeat across a whole directory."""
+    return pydicom.uid.UID(uid).name
+
+@lru_cache(maxsize=256)
+def _transfer_syntax_info(uid):
+    """Return (name, is_compressed) for a transfer syntax UID; is_compressed is None if unknown."""
+    ts_uid = pydicom.uid.UID(uid)
+    try:
+        compressed = ts_uid.is_compressed
+    except (AttributeError, ValueError):
+        # Not a registered transfer syntax
+        compressed = None
+    return ts_uid.name, compressed
+
+# 128-byte preamble plus the 'DICM' prefix
+_PREAMBLE_LENGTH = 132
+
+# Reading the preamble must not update access times on archives being validated
+_OPEN_FLAGS = os.O_RDONLY | getattr(os, 'O_BINARY', 0) | getattr(os, 'O_NOATIME', 0)
+
+def _read_preamble(file_path):
+    """Return the first 132 bytes of a file, or the OSError raised while reading them."""
+    try:
+        try:
+            fd = os.open(file_path, _OPEN_FLAGS)
+        except PermissionError:
+            # O_NOATIME is refused on files the caller does not own
+            fd = os.open(file_path, _OPEN_FLAGS & ~getattr(os, 'O_NOATIME', 0))
+        try:
+            if hasattr(os, 'pread'):
+                # One positional read on a bare descriptor: no file object, buffer or seek
+                return os.pread(fd, _PREAMBLE_LENGTH, 0)
+            return os.read(fd, _PREAMBLE_LENGTH)
+        finally:
+            os.close(fd)
+    except OSError as e:
+        return e
+
+class _DiscardList(list):
+    """Stands in for ``info`` in quiet mode: the messages would never be printed."""
+
+    def append(self, item):
+        pass
 
 class DicomValidator:
     """DICOM file validator."""
 
-    def __init__(self):
-        self.errors = []
-        self.warnings = []
-        self.info = []
+    def __init__(self, deep: bool = False, quiet: bool = False):
+        # deep=True decodes the pixel data instead of checking it against the header only
+        self.deep = deep
+        # quiet=True drops info messages and prints one PASS/FAIL line per file
+        self.quiet = quiet
+        self._reset()
 
     def _reset(self):
         self.errors = []
         self.warnings = []
-        self.info = []
+        self.info = _DiscardList() if self.quiet else []
 
     def validate_file(self, file_path):
         """
@@ -42,46 +154,81 @@ class DicomValidator:
         Returns:
             True if valid (no errors), False otherwise
         """
+        return self._validate_path(file_path)
+
+    def validate_directory(self, paths: Iterable[str], *, workers: Optional[int] = None) -> dict:
+        """
+        Validate many DICOM files, reading their preambles concurrently.
+
+        The first 132 bytes of every file are fetched by a thread pool, so the
+        small blocking reads overlap instead of running one file at a time;
+        each file is then validated in order exactly as validate_file would.
+
+        Args:
+            paths: DICOM file paths to validate
+            workers: Threads used for the preamble reads (default: executor default)
+
+        Returns:
+            Dict mapping each path to True if valid (no errors), False otherwise
+        """
+        paths = list(paths)
+        results = {}
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for file_path, preamble in zip(paths, executor.map(_read_preamble, paths)):
+                results[file_path] = self._validate_path(file_path, preamble)
+        return results
+
+    def _validate_path(self, file_path, preamble=None):
         self._reset()
 
-        print(f"\n{'='*80}")
-        print(f"DICOM File Validation")
-        print(f"{'='*80}")
-        print(f"File: {file_path}\n")
+        if not self.quiet:
+            sys.stdout.write(f"\n{'='*80}\nDICOM File Validation\n{'='*80}\nFile: {file_path}\n\n")
 
         # Check if file exists
         if not os.path.exists(file_path):
-            self.errors.append(f"File does not exist: {file_path}")
-            return False
+            return self._fail_early(f"File does not exist: {file_path}", file_path)
 
         # Check file size
         file_size = os.path.getsize(file_path)
         if file_size == 0:
-            self.errors.append("File is empty")
-            return False
+            return self._fail_early("File is empty", file_path)
 
         self.info.append(f"File size: {file_size:,} bytes ({file_size/1024/1024:.2f} MB)")
 
         # Try to read the file
         try:
-            # `force=True` lets us surface more actionable errors on slightly malformed files
-            dataset = pydicom.dcmread(file_path, force=True)
+            # `force=True` lets us surface more actionable errors on slightly malformed files.
+            # Large values (PixelData above all) are deferred: the header checks never touch
+            # them, and pixel validation reads the pixel bytes from disk only when it decodes them.
+            # Unless decoding, only the tags the checks use are parsed; a decoder may need any tag.
+            specific_tags = None if self.deep else _VALIDATE_TAGS
+            dataset = pydicom.dcmread(file_path, force=True, defer_size='1 KB', specific_tags=specific_tags)
         except Exception as e:
-            self.errors.append(f"Failed to read DICOM file: {e}")
-            return False
+            return self._fail_early(f"Failed to read DICOM file: {e}", file_path)
+
+        return self.validate_dataset(dataset, file_path=file_path, preamble=preamble)
 
-        self._validate_preamble(file_path)
-        return self.validate_dataset(dataset, file_path=file_path)
+    def _fail_early(self, error, file_path):
+        # Files that cannot be read still get their FAIL verdict, which in quiet mode is
+        # the only line printed for them
+        self.errors.append(error)
+        self._print_results(file_path)
+        return False
 
     def validate_dataset(self, dataset: pydicom.dataset.Dataset, *, file_path: Optional[str] = None,
-                         display: bool = True) -> bool:
-        """Validate an in-memory dataset; optionally reference its source path."""
+                         display: bool = True, preamble: Optional[bytes] = None) -> bool:
+        """
+        Validate an in-memory dataset; optionally reference its source path.
+
+        ``preamble`` may carry the file's first 132 bytes when they were
+        already read, so the prefix check does not reopen the file.
+        """
         # Do not reset if called from validate_file which already wiped state
         if not self.info and not self.errors and not self.warnings:
             self._reset()
 
         if file_path:
-            self._validate_preamble(file_path)
+            self._validate_preamble(file_path, preamble)
 
         if not hasattr(dataset, 'file_meta'):
             self.errors.append("Missing file meta information header")
@@ -99,78 +246,54 @@ class DicomValidator:
         self._validate_dates_times(dataset)
 
         if display:
-            self._print_results()
+            self._print_results(file_path)
 
         return len(self.errors) == 0
 
-    def _validate_preamble(self, file_path: str):
-        try:
-            with open(file_path, 'rb') as f:
-                f.read(128)
-                prefix = f.read(4)
+    def _validate_preamble(self, file_path: str, preamble=None):
+        if preamble is None:
+            preamble = _read_preamble(file_path)
+        if isinstance(preamble, OSError):
+            self.warnings.append(f"Could not check DICOM preamble: {preamble}")
+            return
 
-                if prefix != b'DICM':
-                    # Some writers omit the preamble; warn instead of failing to keep validation informative
-                    self.warnings.append("Missing 'DICM' prefix (file may be implicit format)")
-                else:
-                    self.info.append("✓ Valid DICOM prefix found")
-        except Exception as e:
-            self.warnings.append(f"Could not check DICOM preamble: {e}")
+        if preamble[128:132] != b'DICM':
+            # Some writers omit the preamble; warn instead of failing to keep validation informative
+            self.warnings.append("Missing 'DICM' prefix (file may be implicit format)")
+        else:
+            self.info.append("✓ Valid DICOM prefix found")
 
     def _validate_file_meta(self, file_meta):
         """Validate file meta information."""
-        # Minimal set of tags required by Part 10 to describe the encapsulated dataset
-        required_meta = [
-            'FileMetaInformationGroupLength',
-            'FileMetaInformationVersion',
-            'MediaStorageSOPClassUID',
-            'MediaStorageSOPInstanceUID',
-            'TransferSyntaxUID',
-        ]
-
-        for tag in required_meta:
+        for keyword, tag in _FILE_META_TAGS:
             if tag not in file_meta:
-                self.errors.append(f"Missing required file meta tag: {tag}")
+                self.errors.append(f"Missing required file meta tag: {keyword}")
             else:
-                self.info.append(f"✓ {tag} present")
+                self.info.append(f"✓ {keyword} present")
 
     def _validate_required_elements(self, dataset):
         """Validate required DICOM elements."""
         # Common required Type 1 elements
-        required_elements = {
-            'SOPClassUID': 'SOP Class UID',
-            'SOPInstanceUID': 'SOP Instance UID',
-            'StudyInstanceUID': 'Study Instance UID',
-            'SeriesInstanceUID': 'Series Instance UID',
-            'Modality': 'Modality',
-        }
-
-        for tag, description in required_elements.items():
-            if tag not in dataset:
-                self.errors.append(f"Missing required element: {description} ({tag})")
-            elif not dataset.get(tag):
-                self.errors.append(f"Empty required element: {description} ({tag})")
+        for keyword, description, tag in _REQUIRED_ELEMENTS:
+            element = dataset.get(tag)
+            if element is None:
+                self.errors.append(f"Missing required element: {description} ({keyword})")
+            elif not element.value:
+                self.errors.append(f"Empty required element: {description} ({keyword})")
             else:
                 self.info.append(f"✓ {description} present")
 
         # Type 2 elements (must be present but can be empty)
-        type2_elements = {
-            'PatientName': 'Patient Name',
-            'PatientID': 'Patient ID',
-            'StudyDate': 'Study Date',
-            'StudyTime': 'Study Time',
-        }
-
-        for tag, description in type2_elements.items():
+        for keyword, description, tag in _TYPE2_ELEMENTS:
             if tag not in dataset:
-                self.warnings.append(f"Missing Type 2 element: {description} ({tag})")
+                self.warnings.append(f"Missing Type 2 element: {description} ({keyword})")
 
     def _validate_sop_class(self, dataset):
         """Validate SOP Class UID."""
         if 'SOPClassUID' in dataset:
             sop_class_uid = dataset.SOPClassUID
             try:
-                sop_class_name = sop_class_uid.name
+                sop_class_name = _uid_name(str(sop_class_uid))
                 self.info.append(f"✓ SOP Class: {sop_class_name}")
             except AttributeError:
                 self.warnings.append(f"Unknown SOP Class UID: {sop_class_uid}")
@@ -180,11 +303,11 @@ class DicomValidator:
         if hasattr(dataset, 'file_meta') and 'TransferSyntaxUID' in dataset.file_meta:
             ts_uid = dataset.file_meta.TransferSyntaxUID
             try:
-                ts_name = ts_uid.name
+                ts_name, compressed = _transfer_syntax_info(str(ts_uid))
                 self.info.append(f"✓ Transfer Syntax: {ts_name}")
 
-                if hasattr(ts_uid, 'is_compressed'):
-                    if ts_uid.is_compressed:
+                if compressed is not None:
+                    if compressed:
                         self.info.append(f"  Image is compressed")
                     else:
                         self.info.append(f"  Image is uncompressed")
@@ -195,12 +318,16 @@ class DicomValidator:
         """Validate pixel data."""
         try:
             # Check pixel data attributes
-            required_pixel_attrs = ['Rows', 'Columns', 'BitsAllocated', 'BitsStored',
-                                   'HighBit', 'PixelRepresentation', 'PhotometricInterpretation']
+            for keyword, tag in _PIXEL_ATTRIBUTE_TAGS:
+                if tag not in dataset:
+                    self.errors.append(f"Missing required pixel attribute: {keyword}")
 
-            for attr in required_pixel_attrs:
-                if attr not in dataset:
-                    self.errors.append(f"Missing required pixel attribute: {attr}")
+            if not self.deep:
+                if self._is_native_pixel_data(dataset):
+                    self._validate_native_pixel_data(dataset)
+                else:
+                    self._validate_encapsulated_pixel_data(dataset)
+                return
 
             # Try to access pixel array
             try:
@@ -213,19 +340,21 @@ class DicomValidator:
                 cols = dataset.get('Columns', 0)
 
                 # Validate dimensions match
-                if len(shape) >= 2:
-                    actual_rows, actual_cols = shape[-2], shape[-1]
-                    if actual_rows != rows or actual_cols != cols:
-                        self.errors.append(
-                            f"Pixel array dimensions ({actual_cols}x{actual_rows}) "
-                            f"don't match metadata ({cols}x{rows})"
-                        )
-                    else:
-                        self.info.append(f"✓ Pixel data: {cols}x{rows}, dtype={dtype}")
+                expected_shape = self._expected_shape(dataset)
+                if shape != expected_shape:
+                    self.errors.append(
+                        f"Pixel array shape {shape} doesn't match metadata {expected_shape}"
+                    )
+                else:
+                    self.info.append(f"✓ Pixel data: {cols}x{rows}, dtype={dtype}")
+
+                expected_dtype = pixel_dtype(dataset)
+                if dtype != expected_dtype:
+                    self.warnings.append(f"Pixel array dtype {dtype} differs from metadata ({expected_dtype})")
 
                 # Check for multi-frame
-                if len(shape) > 2:
-                    frames = shape[0]
+                frames = get_nr_frames(dataset)
+                if frames > 1:
                     self.info.append(f"  Multi-frame image: {frames} frames")
 
             except Exception as e:
@@ -234,16 +363,82 @@ class DicomValidator:
         except Exception as e:
             self.errors.append(f"Error validating pixel data: {e}")
 
-    def _validate_uids(self, dataset):
-        """Validate UID format and uniqueness."""
-        uid_tags = ['SOPInstanceUID', 'StudyInstanceUID', 'SeriesInstanceUID']
+    @staticmethod
+    def _is_native_pixel_data(dataset):
+        """True for uncompressed little endian pixel data whose layout follows from the header."""
+        ts_uid = dataset.file_meta.get('TransferSyntaxUID') if hasattr(dataset, 'file_meta') else None
+        try:
+            return bool(ts_uid) and not ts_uid.is_compressed and ts_uid.is_little_endian
+        except (AttributeError, ValueError):
+            # Private/unknown transfer syntax: only a full decode can tell
+            return False
 
-        for tag in uid_tags:
-            if tag in dataset:
-                uid = str(dataset.get(tag))
+    def _validate_native_pixel_data(self, dataset):
+        """Check native pixel data against the header without loading or decoding it."""
+        try:
+            # Deferred PixelData already knows its length, so nothing is read from disk
+            try:
+                element = dataset.get_item('PixelData', keep_deferred=True)
+            except TypeError:  # pydicom < 3.0
+                element = dataset.get_item('PixelData')
+            length = len(element.value) if element.value is not None else element.length
+
+            rows = dataset.get('Rows', 0)
+            cols = dataset.get('Columns', 0)
+            expected = get_expected_length(dataset)
+            if length < expected:
+                self.errors.append(
+                    f"Pixel data too short for {cols}x{rows} metadata: "
+                    f"{length:,} bytes, expected {expected:,}"
+                )
+                return
+
+            self.info.append(f"✓ Pixel data: {cols}x{rows}, dtype={pixel_dtype(dataset)}")
+            frames = get_nr_frames(dataset)
+            if frames > 1:
+                self.info.append(f"  Multi-frame image: {frames} frames")
+        except Exception as e:
+            self.errors.append(f"Cannot read pixel array: {e}")
+
+    @staticmethod
+    def _expected_shape(dataset):
+        """Shape pixel_array will have, derived from the header alone."""
+        shape = (int(dataset.Rows), int(dataset.Columns))
+        frames = int(get_nr_frames(dataset))
+        if frames > 1:
+            shape = (frames,) + shape
+        samples = int(dataset.get('SamplesPerPixel', 1))
+        if samples > 1:
+            # pydicom always returns samples last, whatever the PlanarConfiguration
+            shape = shape + (samples,)
+        return shape
+
+    def _validate_encapsulated_pixel_data(self, dataset):
+        """Describe compressed pixel data from the header; decoding is left to --deep."""
+        try:
+            rows = dataset.get('Rows', 0)
+            cols = dataset.get('Columns', 0)
+            self.info.append(f"✓ Pixel data: {cols}x{rows}, dtype={pixel_dtype(dataset)} "
+                             f"(not decoded, shape {self._expected_shape(dataset)})")
+            frames = get_nr_frames(dataset)
+            if frames > 1:
+                self.info.append(f"  Multi-frame image: {frames} frames")
+        except Exception as e:
+            self.warnings.append(f"Cannot derive pixel layout from metadata: {e}")
 
-                # Check UID format (should contain only digits and dots)
-                if not all(c.isdigit() or c == '.' for c in uid):
+    def _validate_uids(self, dataset):
+        """Validate UID format and uniqueness."""
+        for tag, tag_value in _UID_TAGS:
+            element = dataset.get(tag_value)
+            if element is not None:
+                uid = str(element.value)
+                # Well-formed UIDs need none of the diagnostics below
+                if len(uid) <= 64 and _UID_PATTERN.fullmatch(uid):
+                    continue
+
+                # Check UID format (should contain only digits and dots); deleting
+                # the allowed characters in C leaves something only if the UID is bad
+                if uid.translate(_UID_ALLOWED_DELETE):
                     self.errors.append(f"Invalid UID format in {tag}: {uid}")
 
                 # Check UID length (max 64 characters)
@@ -256,93 +451,144 @@ class DicomValidator:
 
     def _validate_dates_times(self, dataset):
         """Validate date and time format."""
-        date_tags = ['StudyDate', 'SeriesDate', 'ContentDate', 'AcquisitionDate']
-        time_tags = ['StudyTime', 'SeriesTime', 'ContentTime', 'AcquisitionTime']
-
-        for tag in date_tags:
-            if tag in dataset:
-                date_str = str(dataset.get(tag))
+        for tag, tag_value in _DATE_TAGS:
+            element = dataset.get(tag_value)
+            if element is not None:
+                date_str = str(element.value)
                 if date_str and not self._is_valid_dicom_date(date_str):
                     self.warnings.append(f"Invalid date format in {tag}: {date_str}")
 
-        for tag in time_tags:
-            if tag in dataset:
-                time_str = str(dataset.get(tag))
+        for tag, tag_value in _TIME_TAGS:
+            element = dataset.get(tag_value)
+            if element is not None:
+                time_str = str(element.value)
                 if time_str and not self._is_valid_dicom_time(time_str):
                     self.warnings.append(f"Invalid time format in {tag}: {time_str}")
 
     def _is_valid_dicom_date(self, date_str):
         """Check if date string is valid DICOM format (YYYYMMDD)."""
-        if len(date_str) != 8:
-            return False
-        try:
-            int(date_str)
-            year = int(date_str[:4])
-            month = int(date_str[4:6])
-            day = int(date_str[6:8])
-            return 1 <= month <= 12 and 1 <= day <= 31 and 1900 <= year <= 2100
-        except ValueError:
-            return False
+        return _DATE_PATTERN.fullmatch(date_str) is not None
 
     def _is_valid_dicom_time(self, time_str):
         """Check if time string is valid DICOM format (HHMMSS.FFFFFF)."""
-        if not time_str:
-            return False
-        try:
-            parts = time_str.split('.')
-            time_part = parts[0]
-            if len(time_part) < 2:
-                return False
-            hour = int(time_part[:2])
-            return 0 <= hour <= 23
-        except (ValueError, IndexError):
-            return False
+        # Only the hour is checked; it must be two ASCII digits
+        return _TIME_HOUR_PATTERN.match(time_str) is not None
 
-    def _print_results(self):
+    def _print_results(self, file_path=None):
         """Print validation results."""
-        print(f"\n{'─'*80}")
-        print("VALIDATION RESULTS")
-        print(f"{'─'*80}\n")
+        if self.errors:
+            verdict = f"✗ VALIDATION FAILED - {len(self.errors)} error(s), {len(self.warnings)} warning(s)"
+        elif self.warnings:
+            verdict = f"⚠ VALIDATION PASSED WITH WARNINGS - {len(self.warnings)} warning(s)"
+        else:
+            verdict = "✓ VALIDATION PASSED - No errors or warnings"
+
+        if self.quiet:
+            sys.stdout.write(f"{verdict}: {file_path}\n" if file_path else f"{verdict}\n")
+            return
+
+        # Assemble the whole report and hand it to stdout in one write
+        lines = [f"\n{'─'*80}", "VALIDATION RESULTS", f"{'─'*80}\n"]
 
         if self.info:
-            print("Information:")
-            for msg in self.info:
-                print(f"  {msg}")
-            print()
+            lines.append("Information:")
+            lines.extend(f"  {msg}" for msg in self.info)
+            lines.append("")
 
         if self.warnings:
-            print("Warnings:")
-            for msg in self.warnings:
-                print(f"  ⚠ {msg}")
-            print()
+            lines.append("Warnings:")
+            lines.extend(f"  ⚠ {msg}" for msg in self.warnings)
+            lines.append("")
 
         if self.errors:
-            print("Errors:")
-            for msg in self.errors:
-                print(f"  ✗ {msg}")
-            print()
-
-        print(f"{'='*80}")
-        if self.errors:
-            print(f"✗ VALIDATION FAILED - {len(self.errors)} error(s), {len(self.warnings)} warning(s)")
-        elif self.warnings:
-            print(f"⚠ VALIDATION PASSED WITH WARNINGS - {len(self.warnings)} warning(s)")
-        else:
-            print("✓ VALIDATION PASSED - No errors or warnings")
-        print(f"{'='*80}\n")
+            lines.append("Errors:")
+            lines.extend(f"  ✗ {msg}" for msg in self.errors)
+            lines.append("")
+
+        lines += [f"{'='*80}", verdict, f"{'='*80}\n"]
+        sys.stdout.write("\n".join(lines) + "\n")
+
+# Below this many files a process pool costs more to start than it saves
+PARALLEL_MIN_FILES = 64
+
+_worker_validator = None
+
+def _init_validate_worker(deep, quiet):
+    global _worker_validator
+    # pydicom warns on every malformed value; in workers that only interleaves noise on stderr
+    warnings.simplefilter('ignore')
+    _worker_validator = DicomValidator(deep=deep, quiet=quiet)
+
+def _validate_one(file_path):
+    """Validate one file in a worker, returning its report text for the parent to print."""
+    report = io.StringIO()
+    with redirect_stdout(report):
+        is_valid = _worker_validator.validate_file(file_path)
+    return file_path, is_valid, report.getvalue()
+
+def validate_many(paths: Iterable[str], *, deep: bool = False, quiet: bool = False,
+                  workers: Optional[int] = None) -> dict:
+    """
+    Validate many DICOM files, parsing them in parallel worker processes.
+
+    Parsing is CPU-bound, so separate processes scale across cores. Each
+    report is printed by the parent in input order, so the output matches a
+    serial run; small batches are validated in-process.
+
+    Args:
+        paths: DICOM file paths to validate
+        deep: Decode pixel data (see DicomValidator)
+        quiet: Print only a PASS/FAIL line per file
+        workers: Worker processes (default: CPU count)
+
+    Returns:
+        Dict mapping each path to True if valid (no errors), False otherwise
+    """
+    paths = list(paths)
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(paths) < PARALLEL_MIN_FILES:
+        return DicomValidator(deep=deep, quiet=quiet).validate_directory(paths)
+
+    # Several chunks per worker keeps the load balanced while amortizing pickling
+    chunksize = max(1, min(32, len(paths) // (workers * 4)))
+    results = {}
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_validate_worker,
+                             initargs=(deep, quiet)) as executor:
+        for file_path, is_valid, report in executor.map(_validate_one, paths, chunksize=chunksize):
+            sys.stdout.write(report)
+            results[file_path] = is_valid
+    return results
 
 def main():
-    if len(sys.argv) > 1:
-        input_file = sys.argv[1]
+    parser = argparse.ArgumentParser(description='Validate DICOM files for conformance and integrity')
+    parser.add_argument('input', nargs='?', help='DICOM file or directory (default: 1.dcm)')
+    parser.add_argument('--deep', action='store_true',
+                        help='Decode pixel data and compare it with the header (slow for compressed files)')
+    parser.add_argument('-q', '--quiet', action='store_true',
+                        help='Print only a PASS/FAIL line per file')
+    parser.add_argument('-j', '--workers', type=int,
+                        help='Worker processes for directory input (default: CPU count)')
+    args = parser.parse_args()
+
+    if args.input:
+        input_file = args.input
     else:
-        print("Usage: dicom-validate <input_file>")
+        print("Usage: dicom-validate [--deep] [--quiet] <input_file|directory>")
         if os.path.exists("1.dcm"):
             input_file = "1.dcm"
         else:
             sys.exit(1)
 
-    validator = DicomValidator()
-    is_valid = validator.validate_file(input_file)
+    if os.path.isdir(input_file):
+        from .batch_process import find_dicom_files
+
+        results = validate_many(find_dicom_files(input_file), deep=args.deep, quiet=args.quiet,
+                                workers=args.workers)
+        valid_count = sum(results.values())
+        print(f"Validation complete: {valid_count} valid, {len(results) - valid_count} invalid")
+        sys.exit(0 if results and all(results.values()) else 1)
+
+    is_valid = DicomValidator(deep=args.deep, quiet=args.quiet).validate_file(input_file)
 
     sys.exit(0 if is_valid else 1)
 
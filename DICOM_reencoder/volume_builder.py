@@ -17,13 +17,45 @@ slice ordering.
 """
 
 import argparse
+import errno
 import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing import shared_memory
 from pathlib import Path
-from typing import Iterable, List, Tuple
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple
 
 import numpy as np
 import pydicom
 
+try:
+    from pydicom.pixels.utils import pixel_dtype
+except ImportError:  # pydicom < 3.0
+    from pydicom.pixel_data_handlers.util import pixel_dtype
+
+try:
+    import orjson
+except ImportError:  # optional accelerator; fall back to the standard library
+    orjson = None
+
+from .core.images import moment_statistics
+
+
+def _json_default(value):
+    # Only reached on the json fallback: orjson serializes NumPy values natively
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def metadata_to_json(metadata: dict) -> bytes:
+    """Serialize volume metadata as indented UTF-8 JSON, using orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(metadata, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(metadata, indent=2, default=_json_default).encode("utf-8")
+
 
 def _require_dicom_numpy():
     try:
@@ -33,26 +65,85 @@ def _require_dicom_numpy():
     return dicom_numpy
 
 
-def _load_sorted_datasets(dicom_dir: Path) -> List[pydicom.dataset.Dataset]:
-    """Load datasets sorted by InstanceNumber (fallback to filename)."""
-    files = sorted(
-        [p for p in dicom_dir.rglob("*") if p.is_file() and p.suffix.lower() in {".dcm", ""}],
-        key=lambda p: p.name,
-    )
+def _iter_slice_files(dicom_dir: Path) -> Iterator[str]:
+    """Yield .dcm and extension-less files below dicom_dir using scandir's cached entry types."""
+    stack = [str(dicom_dir)]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file(follow_symlinks=False) and os.path.splitext(entry.name)[1].lower() in {".dcm", ""}:
+                    yield entry.path
+
+
+def _read_slice(path: str) -> pydicom.dataset.Dataset:
+    try:
+        return pydicom.dcmread(path, force=True)
+    except Exception as exc:  # noqa: BLE001
+        raise RuntimeError(f"Failed to read {path}: {exc}") from exc
+
+
+def _read_slice_header(path: str) -> pydicom.dataset.Dataset:
+    try:
+        return pydicom.dcmread(path, stop_before_pixels=True, force=True)
+    except Exception as exc:  # noqa: BLE001
+        raise RuntimeError(f"Failed to read {path}: {exc}") from exc
+
+
+def _slice_files(dicom_dir: Path) -> List[str]:
+    files = sorted(_iter_slice_files(dicom_dir), key=os.path.basename)
     if not files:
         raise RuntimeError(f"No DICOM files found in {dicom_dir}")
+    return files
+
+
+def _io_workers() -> int:
+    return min(32, (os.cpu_count() or 1) + 4)
+
+
+_SLICE_KEY = np.dtype([("position", np.float64), ("instance", np.int64)])
+
 
-    datasets = []
-    for path in files:
-        try:
-            ds = pydicom.dcmread(path, force=True)
-            datasets.append(ds)
-        except Exception as exc:  # noqa: BLE001
-            raise RuntimeError(f"Failed to read {path}: {exc}") from exc
+def _instance_numbers(datasets: List[pydicom.dataset.Dataset]) -> np.ndarray:
+    return np.fromiter((int(getattr(ds, "InstanceNumber", 0) or 0) for ds in datasets),
+                       dtype=np.int64, count=len(datasets))
 
-    # Sort slices using InstanceNumber to preserve correct anatomical order
-    datasets.sort(key=lambda ds: getattr(ds, "InstanceNumber", 0))
-    return datasets
+
+def _sort_slices(datasets: List[pydicom.dataset.Dataset]) -> List[pydicom.dataset.Dataset]:
+    """
+    Order slices along the slice normal, keeping one slice per position.
+
+    Ties on position are broken by InstanceNumber, and series without
+    patient geometry are ordered by InstanceNumber alone.
+    """
+    try:
+        positions = _slice_positions(datasets)
+    except (AttributeError, TypeError, ValueError):
+        order = np.argsort(_instance_numbers(datasets), kind="stable")
+        return [datasets[index] for index in order]
+
+    keys = np.empty(len(datasets), dtype=_SLICE_KEY)
+    keys["position"] = positions
+    keys["instance"] = _instance_numbers(datasets)
+    order = np.argsort(keys, order=("position", "instance"), kind="stable")
+
+    # Keep the lowest InstanceNumber at each position so duplicated slices never reach combine_slices
+    sorted_positions = keys["position"][order]
+    keep = np.ones(len(order), dtype=bool)
+    keep[1:] = sorted_positions[1:] != sorted_positions[:-1]
+    return [datasets[index] for index in order[keep]]
+
+
+def _load_sorted_datasets(dicom_dir: Path) -> List[pydicom.dataset.Dataset]:
+    """Load datasets sorted by slice position (InstanceNumber when geometry is missing)."""
+    files = _slice_files(dicom_dir)
+
+    # File reads release the GIL, so a thread pool overlaps disk I/O across slices
+    with ThreadPoolExecutor(max_workers=_io_workers()) as executor:
+        datasets = list(executor.map(_read_slice, files))
+
+    return _sort_slices(datasets)
 
 
 def build_volume(dicom_dir: Path) -> Tuple[np.ndarray, np.ndarray, dict]:
@@ -72,19 +163,18 @@ def build_volume(dicom_dir: Path) -> Tuple[np.ndarray, np.ndarray, dict]:
     except dicom_numpy.DicomImportException as exc:
         raise RuntimeError(f"Failed to combine slices: {exc}") from exc
 
-    first = datasets[0]
+    return volume, affine, _volume_metadata(volume, affine, datasets[0])
+
+
+def _volume_metadata(volume: np.ndarray, affine: np.ndarray, first: pydicom.dataset.Dataset) -> dict:
     # Combine in-plane spacing with slice thickness to fully describe voxel size
-    spacing = list(getattr(first, "PixelSpacing", [1.0, 1.0]))
+    spacing = [float(value) for value in getattr(first, "PixelSpacing", [1.0, 1.0])]
     spacing.append(float(getattr(first, "SliceThickness", 1.0)))
 
-    stats = {
-        "min": float(volume.min()),
-        "max": float(volume.max()),
-        "mean": float(volume.mean()),
-        "std": float(volume.std()),
-    }
+    # One fused pass for min/max/mean/std instead of four full sweeps of the volume
+    stats = moment_statistics(volume)
 
-    metadata = {
+    return {
         "shape": list(volume.shape),
         "dtype": str(volume.dtype),
         "affine": affine.tolist(),
@@ -94,9 +184,181 @@ def build_volume(dicom_dir: Path) -> Tuple[np.ndarray, np.ndarray, dict]:
         "stats": stats,
     }
 
+
+def _slice_positions(datasets: List[pydicom.dataset.Dataset]) -> np.ndarray:
+    """Project every ImagePositionPatient onto the slice normal in one matrix product."""
+    orientation = np.asarray(datasets[0].ImageOrientationPatient, dtype=np.float64).reshape(2, 3)
+    slice_cosine = np.cross(orientation[0], orientation[1])
+    positions = np.array([ds.ImagePositionPatient for ds in datasets], dtype=np.float64)
+    return positions @ slice_cosine
+
+
+def _validate_slice_grid(ordered: List[pydicom.dataset.Dataset]) -> None:
+    """The combine_slices consistency checks that matter when stacking slices ourselves."""
+    for name in ("Modality", "SOPClassUID", "SeriesInstanceUID", "Rows", "Columns", "SamplesPerPixel",
+                 "PixelSpacing", "PixelRepresentation", "BitsAllocated"):
+        expected = getattr(ordered[0], name, None)
+        if any(getattr(ds, name, None) != expected for ds in ordered[1:]):
+            raise RuntimeError(f'Failed to combine slices: all slices must have the same value for "{name}"')
+
+    # Orientation checks: the affine assumes one orthonormal row/column basis for every slice
+    orientation = np.asarray(ordered[0].ImageOrientationPatient, dtype=np.float64)
+    row_cosine, column_cosine = orientation[:3], orientation[3:]
+    if not np.isclose(np.dot(row_cosine, column_cosine), 0.0, rtol=0, atol=1e-4):
+        raise RuntimeError(f"Failed to combine slices: Non-orthogonal direction cosines: "
+                           f"{row_cosine}, {column_cosine}")
+    for name, cosine in (("row", row_cosine), ("column", column_cosine)):
+        if not np.isclose(np.linalg.norm(cosine), 1.0, rtol=0, atol=1e-4):
+            raise RuntimeError(f"Failed to combine slices: The {name} direction cosine's magnitude is not 1: {cosine}")
+    for ds in ordered[1:]:
+        if not np.allclose(np.asarray(ds.ImageOrientationPatient, dtype=np.float64), orientation, atol=1e-5):
+            raise RuntimeError('Failed to combine slices: all slices must have the same value for '
+                               '"ImageOrientationPatient" within 1e-05')
+
+    if len(ordered) > 1:
+        gaps = np.diff(np.sort(_slice_positions(ordered)))
+        if not np.allclose(gaps, gaps[0], atol=0, rtol=1e-1):
+            raise RuntimeError("Failed to combine slices: It appears there are missing slices")
+
+
+def _slice_affine(ordered: List[pydicom.dataset.Dataset]) -> np.ndarray:
+    """ijk -> patient xyz transform, computed the same way as dicom_numpy.combine_slices."""
+    first = ordered[0]
+    orientation = np.array(first.ImageOrientationPatient, dtype=float)
+    row_cosine, column_cosine = orientation[:3], orientation[3:]
+    slice_cosine = np.cross(row_cosine, column_cosine)
+    row_spacing, column_spacing = first.PixelSpacing
+
+    if len(ordered) > 1:
+        slice_spacing = np.median(np.diff(_slice_positions(ordered)))
+    else:
+        slice_spacing = getattr(first, "SpacingBetweenSlices", 0)
+
+    affine = np.identity(4, dtype=np.float32)
+    affine[:3, 0] = row_cosine * column_spacing
+    affine[:3, 1] = column_cosine * row_spacing
+    affine[:3, 2] = slice_cosine * slice_spacing
+    affine[:3, 3] = first.ImagePositionPatient
+    return affine
+
+
+def _preallocate(path: Path) -> None:
+    """
+    Reserve disk blocks for a freshly created (sparse) file before it is filled.
+
+    The filesystem can then lay the file out in large extents, and a full disk
+    fails here with OSError instead of as SIGBUS while writing through the map.
+    """
+    if not hasattr(os, "posix_fallocate"):
+        return
+    fd = os.open(path, os.O_WRONLY)
+    try:
+        os.posix_fallocate(fd, 0, os.fstat(fd).st_size)
+    except OSError as exc:
+        # Filesystems without fallocate support just keep the sparse file
+        if exc.errno not in (errno.EOPNOTSUPP, errno.ENOSYS, errno.EINVAL):
+            raise
+    finally:
+        os.close(fd)
+
+
+def _fill_volume(dicom_dir: Path,
+                 allocate: Callable[[np.dtype, Tuple[int, ...]], np.ndarray]) -> Tuple[np.ndarray, np.ndarray, dict]:
+    """
+    Stack the slices of dicom_dir into an array obtained from ``allocate(dtype, shape)``.
+
+    Only slice headers are held in memory; each slice is decoded and copied
+    into the output on its own, so peak RAM stays near one slice per worker
+    instead of every slice plus the stacked volume. ``allocate`` must return a
+    Fortran-ordered array, the layout combine_slices produces.
+    """
+    files = _slice_files(dicom_dir)
+    with ThreadPoolExecutor(max_workers=_io_workers()) as executor:
+        headers = list(executor.map(_read_slice_header, files))
+
+    try:
+        ordered = _sort_slices(headers)
+        _validate_slice_grid(ordered)
+    except (AttributeError, TypeError, ValueError) as exc:
+        # Unlike build_volume there is no InstanceNumber fallback: the affine needs geometry
+        raise RuntimeError(f"Failed to combine slices: {exc}") from exc
+    first = ordered[0]
+
+    # Same output dtype and (column, row, slice) layout as combine_slices
+    rescale = any(hasattr(ds, "RescaleSlope") or hasattr(ds, "RescaleIntercept") for ds in ordered)
+    dtype = np.dtype(np.float32) if rescale else pixel_dtype(first)
+    samples = int(getattr(first, "SamplesPerPixel", 1))
+    slice_shape = ((samples,) if samples > 1 else ()) + (int(first.Columns), int(first.Rows))
+    volume = allocate(dtype, slice_shape + (len(ordered),))
+
+    def fill(index: int) -> None:
+        header = ordered[index]
+        pixels = _read_slice(header.filename).pixel_array.T
+        if rescale:
+            slope = float(getattr(header, "RescaleSlope", 1))
+            intercept = float(getattr(header, "RescaleIntercept", 0))
+            pixels = pixels.astype(np.float32) * slope + intercept
+        volume[..., index] = pixels
+
+    with ThreadPoolExecutor(max_workers=_io_workers()) as executor:
+        list(executor.map(fill, range(len(ordered))))
+
+    affine = _slice_affine(ordered)
+    return volume, affine, _volume_metadata(volume, affine, first)
+
+
+def build_volume_file(dicom_dir: Path, npy_path: Path) -> Tuple[np.ndarray, np.ndarray, dict]:
+    """
+    Build the volume straight into a memory-mapped .npy file.
+
+    The file layout matches np.save() of build_volume()'s array.
+
+    Returns:
+        Same as build_volume(), with the volume backed by ``npy_path``.
+    """
+    def allocate(dtype: np.dtype, shape: Tuple[int, ...]) -> np.ndarray:
+        volume = np.lib.format.open_memmap(npy_path, mode="w+", dtype=dtype, shape=shape, fortran_order=True)
+        _preallocate(npy_path)
+        return volume
+
+    volume, affine, metadata = _fill_volume(dicom_dir, allocate)
+    volume.flush()
     return volume, affine, metadata
 
 
+def build_volume_shared(dicom_dir: Path, shm_name: Optional[str] = None
+                        ) -> Tuple[np.ndarray, np.ndarray, dict, shared_memory.SharedMemory]:
+    """
+    Build the volume into a shared memory block instead of a file.
+
+    Another process attaches with ``SharedMemory(name=metadata["shm_name"])``
+    and wraps the buffer using the shape and dtype from the metadata (Fortran
+    order), so the volume is never written to or read back from disk.
+
+    Returns:
+        volume, affine and metadata as build_volume(), plus the SharedMemory
+        block; the caller owns it and must drop ``volume``, then close() and
+        unlink() the block when done.
+    """
+    blocks = []
+
+    def allocate(dtype: np.dtype, shape: Tuple[int, ...]) -> np.ndarray:
+        size = max(1, int(np.prod(shape)) * dtype.itemsize)
+        blocks.append(shared_memory.SharedMemory(name=shm_name, create=True, size=size))
+        return np.ndarray(shape, dtype=dtype, buffer=blocks[0].buf, order="F")
+
+    try:
+        volume, affine, metadata = _fill_volume(dicom_dir, allocate)
+    except BaseException:
+        for block in blocks:
+            block.close()
+            block.unlink()
+        raise
+
+    metadata["shm_name"] = blocks[0].name
+    return volume, affine, metadata, blocks[0]
+
+
 def _default_output_paths(dicom_dir: Path, output: str | None) -> Tuple[Path, Path]:
     base_name = dicom_dir.name or "volume"
     npy_path = Path(output) if output else Path("output") / f"{base_name}_volume.npy"
@@ -113,17 +375,17 @@ def main() -> None:
     parser.add_argument("--preview", action="store_true", help="Print metadata without writing files")
     args = parser.parse_args()
 
-    volume, affine, metadata = build_volume(Path(args.directory))
-
     if args.preview:
-        print(json.dumps(metadata, indent=2))
+        _, _, metadata = build_volume(Path(args.directory))
+        print(metadata_to_json(metadata).decode("utf-8"))
         return
 
     npy_path, default_meta = _default_output_paths(Path(args.directory), args.output)
     meta_path = Path(args.metadata) if args.metadata else default_meta
 
-    np.save(npy_path, volume)
-    meta_path.write_text(json.dumps(metadata, indent=2), encoding="utf-8")
+    # Slices are written straight into the .npy file rather than stacked in RAM first
+    _, _, metadata = build_volume_file(Path(args.directory), npy_path)
+    meta_path.write_bytes(metadata_to_json(metadata))
 
     print(f"Volume saved to {npy_path} with shape {metadata['shape']} and dtype {metadata['dtype']}")
     print(f"Metadata written to {meta_path}")
@@ -10,29 +10,138 @@
 """Flask-powered web interface for the DICOM toolkit."""
 
 import argparse
+import atexit
+import gzip
+import mmap
+import multiprocessing
+import os
+import shutil
 import tempfile
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime, timezone
+from functools import lru_cache
+from io import BytesIO
 from pathlib import Path
+from typing import Optional
+from urllib.parse import unquote
 
-from flask import Flask, jsonify, render_template, request, send_file
+import numpy as np
+import pydicom
+from flask import Flask, Response, jsonify, render_template, request, send_file
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
+from PIL import Image, features
+from werkzeug.exceptions import RequestEntityTooLarge
 from werkzeug.utils import secure_filename
 
-from .anonymize_dicom import anonymize_dicom
-from .core import calculate_statistics, frame_to_png_bytes, load_dataset, summarize_metadata
-from .validate_dicom import DicomValidator
+try:
+    import orjson
+except ImportError:  # optional accelerator; fall back to the standard library
+    orjson = None
+
+try:
+    from waitress import serve
+except ImportError:  # optional production server; fall back to Werkzeug's
+    serve = None
+
+from .core.gpu import gpu_available, gpu_statistics, gpu_window_frame, load_frames_gpu, supports_gpu
+from .core import (calculate_statistics, frame_to_png_bytes, frame_to_raw_png_bytes, frame_to_webp_bytes,
+                   get_frame, load_dataset, summarize_metadata)
+from .web_jobs import anonymize_job, init_worker, validate_job, validation_report
+
+
+class _OrjsonProvider(DefaultJSONProvider):
+    """JSON provider that encodes with orjson, which also serializes NumPy values natively."""
+
+    def dumps(self, obj, **kwargs) -> str:
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        if kwargs.get("sort_keys", self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        if kwargs.get("indent"):
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=self.default, option=option).decode("utf-8")
+
+    def loads(self, s, **kwargs):
+        # Batch requests post their file lists as JSON bodies
+        return orjson.loads(s)
 
 
 BASE_DIR = Path(__file__).parent
+
+# Free space /dev/shm needs before uploads are kept there (see _upload_root)
+_SHM_MIN_FREE = 1024 * 1024 * 1024
+
+
+def _upload_root() -> Optional[str]:
+    # Uploads are read back within seconds, so keep them on tmpfs when it is present. A
+    # small /dev/shm (64 MiB in a default Docker container) would reject large uploads,
+    # so fall back to the system temp directory unless there is room for several
+    try:
+        shm = os.statvfs("/dev/shm")
+    except OSError:
+        return None
+    return "/dev/shm" if shm.f_bavail * shm.f_frsize >= _SHM_MIN_FREE else None
+
+
 app = Flask(
     __name__,
     template_folder=str(BASE_DIR / "web_templates"),
     static_folder=str(BASE_DIR / "web_static"),
 )
 CORS(app)
+if orjson is not None:
+    app.json = _OrjsonProvider(app)
 
 app.config["MAX_CONTENT_LENGTH"] = 100 * 1024 * 1024
-app.config["UPLOAD_FOLDER"] = tempfile.mkdtemp(prefix="dicom_web_")
+app.config["UPLOAD_FOLDER"] = tempfile.mkdtemp(prefix="dicom_web_", dir=_upload_root())
+# tmpfs pages are only freed when the files are deleted
+atexit.register(shutil.rmtree, app.config["UPLOAD_FOLDER"], ignore_errors=True)
 app.config["ALLOWED_EXTENSIONS"] = {"dcm", "dicom"}
+# Read native pixel data straight to the GPU for previews and stats (set by `dicom-web --gpu`)
+app.config["GPU_PIXELS"] = False
+# app.js/style.css only change with a release; let browsers reuse them for an hour
+app.config["SEND_FILE_MAX_AGE_DEFAULT"] = 3600
+
+# Pillow can be built without libwebp; previews then stay PNG
+_WEBP_AVAILABLE = features.check("webp")
+
+# Read size for streamed uploads
+_STREAM_CHUNK = 1024 * 1024
+
+# JSON responses smaller than this are sent uncompressed (see _compress_json)
+_GZIP_MIN_SIZE = 1024
+
+# Default maximum preview width in pixels (see get_image's ?w=)
+_PREVIEW_WIDTH = 1024
+
+
+# Anonymize/validate work is CPU-bound, so batches and async requests run in worker
+# processes; the pool is only started on first use
+_executor = None
+# Request threads can race to create (or replace) the pool
+_executor_lock = threading.Lock()
+
+# Futures of async single-file requests, keyed by job id until their result is collected;
+# entries are (future, output, creation time) and are dropped after _JOB_TTL if never polled
+_jobs = {}
+_JOB_TTL = 3600
+
+# Stored uploads and anonymized copies, keyed by the name handed back to the client. Names
+# are sanitized once when a file is stored; every later request is a plain lookup
+_files = {}
+
+# Entries kept by each parsed-dataset/preview/stats cache
+_CACHE_SIZE = 16
+
+# Version of each upload whose full (pixel) parse is in _cached_dataset, so header-only
+# requests can reuse it instead of parsing the file a second time; bounded like that cache
+_full_parses = OrderedDict()
+_full_parses_lock = threading.Lock()
 
 
 def allowed_file(filename: str) -> bool:
@@ -40,24 +149,215 @@ def allowed_file(filename: str) -> bool:
     return "." in filename and filename.rsplit(".", 1)[1].lower() in app.config["ALLOWED_EXTENSIONS"]
 
 
-def _uploaded_path(filename: str) -> Path:
-    return Path(app.config["UPLOAD_FOLDER"]) / secure_filename(filename)
+def _upload_target(filename: str) -> Path:
+    # `filename` must already be sanitized
+    return Path(app.config["UPLOAD_FOLDER"]) / filename
+
 
+def _read_mapped(path: str):
+    """Fully parse an upload from a read-only memory map of the file."""
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            # Empty files cannot be mapped; let the shared loader report the problem
+            return load_dataset(path, force=True)
+        # pydicom copies every value out of the mapping, so it can be closed right after the
+        # parse; the upload was just written, so its pages come from the page cache
+        # without read() calls through Python's file buffers
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            if hasattr(mmap, "MADV_SEQUENTIAL"):
+                mapped.madvise(mmap.MADV_SEQUENTIAL)
+            dataset = pydicom.dcmread(mapped, force=True)
+    dataset.filename = path
+    return dataset
 
-def _load_uploaded(filename: str):
-    path = _uploaded_path(filename)
-    if not path.exists():
+
+def _file_version(filename: str) -> Optional[tuple]:
+    """Return (path, (mtime_ns, size)) for a registered upload, or None if it is gone."""
+    path = _files.get(filename)
+    try:
+        stat = path.stat() if path is not None else None
+    except FileNotFoundError:
+        return None
+    return (str(path), (stat.st_mtime_ns, stat.st_size)) if stat is not None else None
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def _cached_dataset(path: str, version: tuple, pixels: bool):
+    # The UI hits several endpoints for the same upload back to back; the file version
+    # (mtime and size) in the key makes an overwritten upload (re-upload, anonymize) miss
+    # instead of going stale, even where the filesystem's mtime is coarse.
+    # Header-only endpoints defer large values: PixelData stays detectable but is not read
+    # (deferred values are re-read from the path, so those parses do not use a mapping).
+    if pixels:
+        dataset = _read_mapped(path)
+        with _full_parses_lock:
+            _full_parses[path] = version
+            _full_parses.move_to_end(path)
+            if len(_full_parses) > _CACHE_SIZE:
+                _full_parses.popitem(last=False)
+        return dataset
+    # Use the shared loader so the web API matches CLI behavior
+    return load_dataset(path, force=True, defer_size="1 KB")
+
+
+def _gpu_header(path: str, version: tuple):
+    """Return the deferred header when the GPU path is enabled and can read this file, else None."""
+    if not app.config["GPU_PIXELS"]:
+        return None
+    header = _cached_dataset(path, version, False)
+    return header if supports_gpu(header) else None
+
+
+def _encode_preview(pixels, webp: bool, max_width: int) -> bytes:
+    image = Image.fromarray(pixels)
+    if max_width and image.width > max_width:
+        image = image.reduce(-(-image.width // max_width))
+    buffer = BytesIO()
+    if webp:
+        image.save(buffer, format="WEBP", quality=80, method=0)
+    else:
+        image.save(buffer, format="PNG", compress_level=1)
+    return buffer.getvalue()
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def _cached_preview(path: str, version: tuple, webp: bool, max_width: int) -> bytes:
+    header = _gpu_header(path, version)
+    if header is not None:
+        # Only the requested frame is read, and only the 8-bit result comes back to the host
+        return _encode_preview(gpu_window_frame(header, load_frames_gpu(path, header, 0)), webp, max_width)
+
+    dataset = _cached_dataset(path, version, True)
+    if webp:
+        return frame_to_webp_bytes(dataset, max_width=max_width).getvalue()
+    # Previews favour encode speed over size: level 1 is several times faster than the default
+    return frame_to_png_bytes(dataset, compress_level=1, max_width=max_width).getvalue()
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def _cached_raw_preview(path: str, version: tuple) -> tuple:
+    buffer, offset = frame_to_raw_png_bytes(_cached_dataset(path, version, True))
+    return buffer.getvalue(), offset
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def _cached_stats(path: str, version: tuple) -> dict:
+    # Reopening the stats tab, or switching back to it from the preview, reuses the result
+    # instead of running another pass over the frame
+    header = _gpu_header(path, version)
+    if header is not None:
+        return gpu_statistics(load_frames_gpu(path, header, 0))
+    return calculate_statistics(get_frame(_cached_dataset(path, version, True)))
+
+
+def _load_uploaded(filename: str, *, pixels: bool = True):
+    """Return (dataset, error response); datasets are shared between requests, so do not mutate them."""
+    found = _file_version(filename)
+    if found is None:
         return None, (jsonify({"error": "File not found"}), 404)
+    return _load_version(*found, pixels=pixels)
+
+
+def _load_version(path: str, version: tuple, *, pixels: bool = True):
+    """_load_uploaded for a (path, version) the caller already got from _file_version."""
+    # Uploads are fully parsed up front; a header-only request is served from that parse
+    # (if it has since been evicted from the cache, this re-reads the pixels once)
+    pixels = pixels or _full_parses.get(path) == version
     try:
-        # Use the shared loader so the web API matches CLI behavior
-        return load_dataset(path, force=True), None
+        return _cached_dataset(path, version, pixels), None
     except Exception as exc:  # pragma: no cover - surfaced to client
         return None, (jsonify({"error": str(exc)}), 400)
 
 
+def _process_pool() -> ProcessPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            # Forking a threaded server (and numba's thread pool) can deadlock the child; the
+            # forkserver starts workers from a clean single-threaded process instead
+            methods = multiprocessing.get_all_start_methods()
+            context = multiprocessing.get_context("forkserver" if "forkserver" in methods else None)
+            _executor = ProcessPoolExecutor(max_workers=os.cpu_count(), mp_context=context,
+                                            initializer=init_worker)
+        return _executor
+
+
+def _submit(fn, *args) -> Future:
+    global _executor
+    pool = _process_pool()
+    try:
+        return pool.submit(fn, *args)
+    except BrokenProcessPool:
+        # A worker died (crash, OOM kill) and an executor never recovers from that, so
+        # replace it once; the threads that lose the race just submit to the new pool
+        with _executor_lock:
+            if _executor is pool:
+                _executor = None
+        pool.shutdown(wait=False, cancel_futures=True)
+        return _process_pool().submit(fn, *args)
+
+
+def _job_result(future: Future) -> dict:
+    try:
+        return future.result()
+    except BrokenProcessPool:
+        # The pool is replaced on the next submit
+        return {"error": "Worker process exited unexpectedly"}
+
+
+def _submit_job(fn, *args, output: Optional[Path] = None):
+    # `output` is registered under its name once the job has written it successfully
+    # Drop jobs whose client never came back for the result
+    cutoff = time.monotonic() - _JOB_TTL
+    for stale_id, (future, _, created) in list(_jobs.items()):
+        if created < cutoff:
+            future.cancel()
+            _jobs.pop(stale_id, None)
+
+    job_id = uuid.uuid4().hex
+    _jobs[job_id] = (_submit(fn, *args), output, time.monotonic())
+    return jsonify({"job_id": job_id}), 202
+
+
+def _batch_filenames():
+    """Return (filenames, error response) for a batch request's JSON body."""
+    filenames = (request.get_json(silent=True) or {}).get("filenames")
+    if not isinstance(filenames, list) or not all(isinstance(name, str) for name in filenames):
+        return None, (jsonify({"error": "Expected a JSON body with a 'filenames' list"}), 400)
+    return filenames, None
+
+
+@lru_cache(maxsize=1)
+def _index_page() -> tuple:
+    # The page only resolves static URLs, so render it once and keep a gzip copy alongside
+    html = render_template("index.html").encode("utf-8")
+    return html, gzip.compress(html, 6)
+
+
+@app.after_request
+def _compress_json(response: Response) -> Response:
+    # Metadata and validation reports can list hundreds of tags; gzip shrinks that JSON
+    # several-fold for remote clients, while small replies are not worth the CPU
+    if response.mimetype != "application/json" or response.direct_passthrough or response.content_encoding:
+        return response
+    response.vary.add("Accept-Encoding")
+    data = response.get_data()
+    if len(data) >= _GZIP_MIN_SIZE and "gzip" in request.accept_encodings:
+        response.set_data(gzip.compress(data, 5))
+        response.content_encoding = "gzip"
+    return response
+
+
 @app.route("/")
 def index():
-    return render_template("index.html")
+    html, compressed = _index_page()
+    if "gzip" in request.accept_encodings:
+        response = Response(compressed, mimetype="text/html")
+        response.content_encoding = "gzip"
+    else:
+        response = Response(html, mimetype="text/html")
+    response.vary.add("Accept-Encoding")
+    return response
 
 
 @app.route("/api/upload", methods=["POST"])
@@ -73,17 +373,79 @@ def upload_file():
         return jsonify({"error": "Unsupported file type"}), 400
 
     filename = secure_filename(file.filename)
-    filepath = _uploaded_path(filename)
+    filepath = _upload_target(filename)
+    filepath.parent.mkdir(parents=True, exist_ok=True)
+
+    _files.pop(filename, None)
+    # FileStorage.save copies in 16 KiB steps; large uploads are spooled to a temp file,
+    # so copying in 1 MiB blocks cuts the syscall count by 64x
+    with os.fdopen(os.open(filepath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), "wb") as dst:
+        shutil.copyfileobj(file.stream, dst, _STREAM_CHUNK)
+
+    return _upload_response(filename, filepath)
+
+
+@app.route("/api/upload_stream", methods=["PUT"])
+def upload_stream():
+    """Store a raw request body as the upload, bypassing multipart parsing and buffering."""
+    raw_name = unquote(request.headers.get("X-Filename", ""))
+    if not raw_name:
+        return jsonify({"error": "Missing X-Filename header"}), 400
+    if not allowed_file(raw_name):
+        return jsonify({"error": "Unsupported file type"}), 400
+
+    filename = secure_filename(raw_name)
+    filepath = _upload_target(filename)
     filepath.parent.mkdir(parents=True, exist_ok=True)
-    file.save(filepath)
 
-    dataset, error = _load_uploaded(filename)
+    _files.pop(filename, None)
+    # Copy the body to disk as it arrives; the counter enforces the size cap even for
+    # chunked bodies that carry no Content-Length
+    limit = app.config["MAX_CONTENT_LENGTH"]
+    written = 0
+    fd = os.open(filepath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    try:
+        while True:
+            chunk = request.stream.read(_STREAM_CHUNK)
+            if not chunk:
+                break
+            written += len(chunk)
+            if limit is not None and written > limit:
+                raise RequestEntityTooLarge()
+            view = memoryview(chunk)
+            while view:
+                view = view[os.write(fd, view):]
+    except Exception:
+        os.close(fd)
+        filepath.unlink(missing_ok=True)
+        raise
+    os.close(fd)
+
+    if not written:
+        filepath.unlink(missing_ok=True)
+        return jsonify({"error": "Empty upload"}), 400
+    return _upload_response(filename, filepath)
+
+
+def _upload_response(filename: str, filepath: Path):
+    # Parse with pixels: the UI asks for the preview and stats right after an upload,
+    # and both reuse this cached dataset instead of reading the file again
+    # (with the GPU path the device reads the pixels, so only the header is parsed)
+    _files[filename] = filepath
+    dataset, error = _load_uploaded(filename, pixels=not app.config["GPU_PIXELS"])
     if error:
+        del _files[filename]
         filepath.unlink(missing_ok=True)
         return error
 
     summary = summarize_metadata(dataset)
     has_pixel_data = "PixelData" in dataset
+    if has_pixel_data and not app.config["GPU_PIXELS"]:
+        try:
+            # Decode once now; pydicom keeps the array on the dataset for later requests
+            dataset.pixel_array
+        except Exception:  # pragma: no cover - reported by /api/image and /api/stats
+            pass
 
     return jsonify({
         "success": True,
@@ -95,7 +457,7 @@ def upload_file():
 
 @app.route("/api/metadata/<filename>")
 def get_metadata(filename: str):
-    dataset, error = _load_uploaded(filename)
+    dataset, error = _load_uploaded(filename, pixels=False)
     if error:
         return error
     return jsonify(summarize_metadata(dataset))
@@ -103,66 +465,185 @@ def get_metadata(filename: str):
 
 @app.route("/api/image/<filename>")
 def get_image(filename: str):
-    dataset, error = _load_uploaded(filename)
-    if error:
-        return error
-    if "PixelData" not in dataset:
-        return jsonify({"error": "No pixel data in file"}), 400
-
-    png_bytes = frame_to_png_bytes(dataset)
-    png_bytes.seek(0)
-    return send_file(png_bytes, mimetype="image/png", download_name=f"{filename}.png")
+    # Browsers that accept WebP get a much smaller preview that encodes about as fast
+    # (PNG is listed first so clients that only send */* keep getting PNG)
+    # ?raw=1 returns the stored values as a lossless 8/16-bit PNG for clients that window themselves
+    raw = request.args.get("raw") == "1"
+    webp = (not raw and _WEBP_AVAILABLE
+            and request.accept_mimetypes.best_match(["image/png", "image/webp"]) == "image/webp")
+    extension = "webp" if webp else "png"
+    # The viewer panel is at most about 1024 px wide, so larger frames are reduced before
+    # encoding unless the client asks for another width (?w=0 keeps full resolution)
+    max_width = max(0, request.args.get("w", _PREVIEW_WIDTH, type=int))
+    variant = "raw" if raw else f"{extension}-{max_width}"
+
+    # The preview only depends on the file, format and width, so revalidations can be
+    # answered from the file's stat alone, before anything is parsed or rendered
+    found = _file_version(filename)
+    if found is None:
+        return jsonify({"error": "File not found"}), 404
+    path, version = found
+    etag = f"{version[0]:x}-{version[1]:x}-{variant}"
+    modified = datetime.fromtimestamp(version[0] // 1_000_000_000, timezone.utc)
+    # If-None-Match takes precedence; If-Modified-Since covers clients that only keep the date
+    if request.if_none_match:
+        not_modified = etag in request.if_none_match
+    else:
+        not_modified = request.if_modified_since is not None and modified <= request.if_modified_since
+    if not_modified:
+        response = Response(status=304)
+    else:
+        dataset, error = _load_version(path, version)
+        if error:
+            return error
+        if "PixelData" not in dataset:
+            return jsonify({"error": "No pixel data in file"}), 400
+
+        if raw:
+            try:
+                data, offset = _cached_raw_preview(path, version)
+            except ValueError as exc:
+                return jsonify({"error": str(exc)}), 400
+        else:
+            data, offset = _cached_preview(path, version, webp, max_width), None
+        response = send_file(BytesIO(data), mimetype=f"image/{extension}", download_name=f"{filename}.{extension}")
+        if offset is not None:
+            # PNG samples are unsigned: stored value = PNG value - offset
+            response.headers["X-Pixel-Offset"] = str(offset)
+    response.set_etag(etag)
+    response.last_modified = modified
+    # Uploads are per-user; send_file's static-asset defaults (public, 1 hour) do not apply
+    response.cache_control.public = False
+    response.cache_control.private = True
+    response.cache_control.max_age = 300
+    response.vary.add("Accept")
+    return response
 
 
 @app.route("/api/stats/<filename>")
 def get_pixel_stats(filename: str):
-    dataset, error = _load_uploaded(filename)
+    # One stat of the file serves both the dataset and the stats cache key
+    found = _file_version(filename)
+    if found is None:
+        return jsonify({"error": "File not found"}), 404
+    dataset, error = _load_version(*found, pixels=not app.config["GPU_PIXELS"])
     if error:
         return error
     if "PixelData" not in dataset:
         return jsonify({"error": "No pixel data in file"}), 400
-
-    stats = calculate_statistics(dataset.pixel_array if dataset.pixel_array.ndim == 2 else dataset.pixel_array[0])
-    return jsonify(stats)
+    return jsonify(_cached_stats(*found))
 
 
 @app.route("/api/validate/<filename>")
 def validate_file(filename: str):
-    dataset, error = _load_uploaded(filename)
+    if request.args.get("async") == "1":
+        path = _files.get(filename)
+        if path is None:
+            return jsonify({"error": "File not found"}), 404
+        return _submit_job(validate_job, str(path))
+
+    dataset, error = _load_uploaded(filename, pixels=False)
     if error:
         return error
+    return jsonify(validation_report(dataset))
 
-    validator = DicomValidator()
-    is_valid = validator.validate_dataset(dataset, display=False)
-    return jsonify({
-        "valid": is_valid,
-        "errors": validator.errors,
-        "warnings": validator.warnings,
-        "info": validator.info,
-    })
+
+@app.route("/api/validate_batch", methods=["POST"])
+def validate_batch():
+    filenames, error = _batch_filenames()
+    if error:
+        return error
+
+    results = {name: {"error": "File not found"} for name in filenames}
+    found = [name for name in filenames if name in _files]
+    futures = [_submit(validate_job, str(_files[name])) for name in found]
+    for name, future in zip(found, futures):
+        results[name] = _job_result(future)
+    return jsonify({"results": results})
 
 
 @app.route("/api/anonymize/<filename>", methods=["POST"])
 def anonymize_file(filename: str):
-    filepath = _uploaded_path(filename)
-    if not filepath.exists():
+    filepath = _files.get(filename)
+    if filepath is None:
         return jsonify({"error": "File not found"}), 404
 
     output_filename = f"anon_{filename}"
-    output_filepath = _uploaded_path(output_filename)
-    try:
-        anonymize_dicom(filepath, output_filepath)
-        return jsonify({"success": True, "filename": output_filename})
-    except Exception as exc:  # pragma: no cover - surfaced to client
-        return jsonify({"error": str(exc)}), 500
+    output_filepath = _upload_target(output_filename)
+    if request.args.get("async") == "1":
+        return _submit_job(anonymize_job, str(filepath), str(output_filepath), output=output_filepath)
+    # Anonymizing is pure-Python work that would hold the GIL against the other request
+    # threads, so even the synchronous form runs in a worker process
+    result = _job_result(_submit(anonymize_job, str(filepath), str(output_filepath)))
+    if "error" in result:
+        return jsonify(result), 500
+    _files[output_filename] = output_filepath
+    return jsonify(result)
+
+
+@app.route("/api/anonymize_batch", methods=["POST"])
+def anonymize_batch():
+    filenames, error = _batch_filenames()
+    if error:
+        return error
+
+    results = {name: {"error": "File not found"} for name in filenames}
+    found = [name for name in filenames if name in _files]
+    out_paths = [_upload_target(f"anon_{name}") for name in found]
+    futures = [_submit(anonymize_job, str(_files[name]), str(output_path))
+               for name, output_path in zip(found, out_paths)]
+    for name, output_path, future in zip(found, out_paths, futures):
+        result = _job_result(future)
+        if "error" not in result:
+            _files[output_path.name] = output_path
+        results[name] = result
+    return jsonify({"results": results})
+
+
+@app.route("/api/jobs/<job_id>")
+def get_job(job_id: str):
+    job = _jobs.get(job_id)
+    if job is None:
+        return jsonify({"error": "Unknown job"}), 404
+    future, output, _ = job
+    if not future.done():
+        return jsonify({"status": "running"})
+
+    # Finished jobs are collected once, so the table does not grow with the server's uptime
+    _jobs.pop(job_id, None)
+    result = _job_result(future)
+    if output is not None and "error" not in result:
+        _files[output.name] = output
+    status = 500 if "error" in result else 200
+    return jsonify({"status": "done", "result": result}), status
 
 
 @app.route("/api/download/<filename>")
 def download_file(filename: str):
-    path = _uploaded_path(filename)
-    if not path.exists():
+    path = _files.get(filename)
+    if path is None:
+        return jsonify({"error": "File not found"}), 404
+    # send_file already answers If-None-Match/If-Modified-Since with 304 and Range with 206
+    # from the file's stat-based ETag; a re-upload under the same name changes that ETag, so
+    # have clients revalidate every time instead of the one-hour public static-file default
+    try:
+        # send_file stats the file anyway; a missing file surfaces here rather than
+        # through a separate exists() check
+        response = send_file(path, as_attachment=True, download_name=filename)
+    except FileNotFoundError:
         return jsonify({"error": "File not found"}), 404
-    return send_file(path, as_attachment=True, download_name=filename)
+    response.cache_control.public = False
+    response.cache_control.private = True
+    response.cache_control.no_cache = True
+    response.cache_control.max_age = None
+    return response
+
+
+def _warm_up_kernels():
+    # Numba compiles (or loads from its on-disk cache) one kernel per pixel dtype on first
+    # use; doing it at startup keeps that cost off the first upload's stats request
+    for dtype in (np.uint8, np.uint16, np.int16, np.int32, np.float32, np.float64):
+        calculate_statistics(np.zeros((8, 8), dtype=dtype))
 
 
 def main():
@@ -170,14 +651,34 @@ def main():
     parser.add_argument("-H", "--host", default="127.0.0.1", help="Host to bind to (default: 127.0.0.1)")
     parser.add_argument("-p", "--port", type=int, default=5000, help="Port to bind to (default: 5000)")
     parser.add_argument("--debug", action="store_true", help="Enable debug mode")
+    parser.add_argument("--threads", type=int, default=min(16, (os.cpu_count() or 2) * 2),
+                        help="Request threads for the waitress server (default: 2 per CPU, up to 16)")
+    parser.add_argument("--gpu", action="store_true",
+                        help="Read uncompressed pixel data onto the GPU for previews and stats "
+                             "(requires kvikio and cupy)")
     args = parser.parse_args()
 
+    if args.gpu:
+        if gpu_available():
+            app.config["GPU_PIXELS"] = True
+        else:
+            print("Warning: --gpu needs kvikio, cupy and a CUDA device; using the CPU path")
+
+    _warm_up_kernels()
+
     print("\n" + "=" * 72)
     print("DICOM Tools Web Interface")
     print("=" * 72 + "\n")
     print(f"Serving on http://{args.host}:{args.port}\n")
 
-    app.run(host=args.host, port=args.port, debug=args.debug)
+    if args.debug:
+        app.run(host=args.host, port=args.port, debug=True)
+    elif serve is not None:
+        # The UI fires metadata, image and stats requests together; threads let them overlap,
+        # and the heavy work either releases the GIL (decode, encode, Numba) or runs in the pool
+        serve(app, host=args.host, port=args.port, threads=max(1, args.threads))
+    else:
+        app.run(host=args.host, port=args.port, threaded=True)
 
 
 if __name__ == "__main__":
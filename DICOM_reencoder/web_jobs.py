@@ -0,0 +1,58 @@
+#
+# web_jobs.py
+# Dicom-Tools-py
+#
+# Runs the web interface's CPU-bound anonymize/validate work inside worker processes.
+#
+# Thales Matheus Mendonça Santos - November 2025
+
+"""Worker-process jobs for the web interface.
+
+Kept apart from web_interface so workers import only what the jobs need,
+not the Flask app and its upload directory.
+"""
+
+import io
+import os
+import warnings
+from contextlib import redirect_stdout
+
+from .anonymize_dicom import anonymize_dicom
+from .core import load_dataset
+from .validate_dicom import DicomValidator
+
+
+def init_worker():
+    # Import pydicom's pixel/UID machinery once per worker rather than on its first job
+    import pydicom.pixels  # noqa: F401
+
+    # pydicom warns on every malformed value; in workers that only interleaves noise on stderr
+    warnings.simplefilter("ignore")
+
+
+def validation_report(dataset) -> dict:
+    validator = DicomValidator()
+    is_valid = validator.validate_dataset(dataset, display=False)
+    return {
+        "valid": is_valid,
+        "errors": validator.errors,
+        "warnings": validator.warnings,
+        "info": validator.info,
+    }
+
+
+def validate_job(path: str) -> dict:
+    try:
+        return validation_report(load_dataset(path, force=True, defer_size="1 KB"))
+    except Exception as exc:
+        return {"error": str(exc)}
+
+
+def anonymize_job(input_path: str, output_path: str) -> dict:
+    try:
+        # The per-tag log is for the CLI; keep worker output off the server console
+        with redirect_stdout(io.StringIO()):
+            anonymize_dicom(input_path, output_path)
+        return {"success": True, "filename": os.path.basename(output_path)}
+    except Exception as exc:
+        return {"error": str(exc)}
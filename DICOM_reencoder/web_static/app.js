@@ -85,15 +85,18 @@ function renderValidation(result) {
 }
 
 async function uploadFile(file) {
-  const formData = new FormData();
-  formData.append('file', file);
   setStatus('Uploading…');
   enableActions(false);
   viewer.classList.add('muted');
   viewer.innerHTML = 'Processing…';
 
   try {
-    const res = await fetch('/api/upload', { method: 'POST', body: formData });
+    // Send the raw file body; the server streams it to disk without multipart parsing
+    const res = await fetch('/api/upload_stream', {
+      method: 'PUT',
+      headers: { 'X-Filename': encodeURIComponent(file.name) },
+      body: file,
+    });
     const data = await res.json();
     if (!res.ok || !data.success) {
       throw new Error(data.error || 'Upload failed');
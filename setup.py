@@ -48,10 +48,14 @@ setup(
             'gdcm>=3.0.0',
             'SimpleITK>=2.2.0',
             'dicom-numpy>=0.5.0',
+            'numba>=0.57.0',
+            'isal>=1.0.0',
+            'orjson>=3.6.0',
         ],
         'web': [
             'flask>=2.0.0',
             'flask-cors>=3.0.0',
+            'waitress>=2.0.0',
         ],
         'networking': [
             'pynetdicom>=2.0.0',
@@ -60,6 +64,10 @@ setup(
             'gdcm>=3.0.0',
             'SimpleITK>=2.2.0',
             'dicom-numpy>=0.5.0',
+            'numba>=0.57.0',
+            'isal>=1.0.0',
+            'orjson>=3.6.0',
+            'waitress>=2.0.0',
         ],
     },
 
@@ -12,19 +12,19 @@ from DICOM_reencoder.core import load_dataset
 from DICOM_reencoder.core.factories import build_synthetic_series
 
 
-@pytest.fixture(scope="function")
-def synthetic_series(tmp_path):
-    # Generate a small, deterministic CT series for downstream tests
-    paths = build_synthetic_series(tmp_path / "series")
+@pytest.fixture(scope="session")
+def synthetic_series(tmp_path_factory):
+    # Generate a small, deterministic CT series once; tests only read it, so it is shared
+    paths = build_synthetic_series(tmp_path_factory.mktemp("series"))
     datasets = [load_dataset(p) for p in paths]
     return paths, datasets
 
 
-@pytest.fixture(scope="function")
+@pytest.fixture(scope="session")
 def synthetic_dicom_path(synthetic_series):
     return synthetic_series[0][0]
 
 
-@pytest.fixture(scope="function")
+@pytest.fixture(scope="session")
 def synthetic_datasets(synthetic_series):
     return synthetic_series[1]
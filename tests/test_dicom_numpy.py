@@ -8,6 +8,11 @@
 
 import pytest
 import numpy as np
+import pydicom
+
+from DICOM_reencoder.core import load_dataset
+from DICOM_reencoder.core.factories import build_synthetic_series
+from DICOM_reencoder.volume_builder import _sort_slices, build_volume_file
 
 dicom_numpy = pytest.importorskip("dicom_numpy")
 
@@ -19,3 +24,32 @@ def test_dicom_numpy_combine_slices(synthetic_datasets):
     assert sorted(voxel_array.shape) == sorted((len(synthetic_datasets), 32, 32))
     assert affine.shape == (4, 4)
     assert np.allclose(affine[2, 2], 1.0)
+
+
+def test_sort_slices_keeps_lowest_instance_per_position(synthetic_series):
+    # Fresh copies: the session fixture's datasets are shared and must not be modified
+    datasets = [load_dataset(path) for path in synthetic_series[0]]
+    duplicate = load_dataset(synthetic_series[0][1])
+    duplicate.InstanceNumber = 10
+
+    ordered = _sort_slices([duplicate] + datasets[::-1])
+
+    assert [int(ds.InstanceNumber) for ds in ordered] == [1, 2, 3, 4]
+    assert [float(ds.ImagePositionPatient[2]) for ds in ordered] == [0.0, 1.0, 2.0, 3.0]
+
+
+@pytest.mark.parametrize("orientation, slices, message", [
+    # One slice rotated relative to the rest of the series
+    ([1, 0, 0, 0, 0.9, 0.1], [2], "ImageOrientationPatient"),
+    # Row and column cosines that are not perpendicular
+    ([1, 0, 0, 0.5, 1, 0], [0, 1, 2, 3], "Non-orthogonal"),
+])
+def test_build_volume_file_rejects_invalid_orientation(tmp_path, orientation, slices, message):
+    paths = build_synthetic_series(tmp_path / "series")
+    for index in slices:
+        dataset = pydicom.dcmread(paths[index])
+        dataset.ImageOrientationPatient = orientation
+        dataset.save_as(paths[index])
+
+    with pytest.raises(RuntimeError, match=message):
+        build_volume_file(tmp_path / "series", tmp_path / "volume.npy")
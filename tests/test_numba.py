@@ -0,0 +1,68 @@
+#
+# test_numba.py
+# Dicom-Tools-py
+#
+# Checks the numba statistics kernels against plain NumPy reductions.
+#
+# Thales Matheus Mendonça Santos - November 2025
+
+import tracemalloc
+
+import numpy as np
+import pytest
+
+from DICOM_reencoder.core import calculate_statistics
+from DICOM_reencoder.core.images import moment_statistics
+
+
+numba = pytest.importorskip("numba")
+
+
+@pytest.mark.parametrize("dtype", [np.uint8, np.uint16, np.int16])
+def test_numba_statistics_match_numpy(dtype):
+    # The single-pass histogram kernel must reproduce NumPy's reductions and percentiles
+    info = np.iinfo(dtype)
+    rng = np.random.default_rng(0)
+    pixels = rng.integers(max(info.min, -1024), min(info.max, 4096), size=(64, 48)).astype(dtype)
+
+    stats = calculate_statistics(pixels)
+
+    assert stats["min"] == pixels.min()
+    assert stats["max"] == pixels.max()
+    assert stats["unique_values"] == len(np.unique(pixels))
+    assert stats["zero_pixels"] == np.count_nonzero(pixels == 0)
+    assert stats["mean"] == pytest.approx(pixels.mean())
+    assert stats["std"] == pytest.approx(pixels.std())
+    for q in (1, 5, 25, 50, 75, 95, 99):
+        key = "median" if q == 50 else f"p{q}"
+        assert stats[key] == pytest.approx(np.percentile(pixels, q))
+
+
+@pytest.mark.parametrize("dtype", [np.int16, np.float32, np.float64])
+def test_numba_moments_match_numpy(dtype):
+    # The fused min/max/mean/std pass used for volumes must agree with separate reductions
+    rng = np.random.default_rng(0)
+    volume = (rng.normal(40.0, 300.0, size=(6, 32, 24))).astype(dtype)
+
+    stats = moment_statistics(volume)
+
+    assert stats["min"] == pytest.approx(float(volume.min()))
+    assert stats["max"] == pytest.approx(float(volume.max()))
+    assert stats["mean"] == pytest.approx(volume.mean(dtype=np.float64))
+    assert stats["std"] == pytest.approx(volume.std(dtype=np.float64))
+
+
+def test_moment_statistics_does_not_copy_fortran_volume():
+    # Volumes come back Fortran-ordered from combine_slices and open_memmap; flattening must not copy them
+    volume = np.asfortranarray(np.arange(64 * 64 * 64, dtype=np.float64).reshape(64, 64, 64))
+    moment_statistics(volume[:2])
+
+    tracemalloc.start()
+    try:
+        stats = moment_statistics(volume)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert peak < volume.nbytes // 4
+    assert stats["max"] == float(volume.max())